@@ -0,0 +1,237 @@
+"""
+Chart Renderer
+Renders chart specs (data plus plot kind plus options) to image files in a
+process pool. Every chart is drawn on its own Agg canvas, so charts are
+independent of pyplot state and of each other.
+
+A spec is a plain dict:
+
+    {'kind': 'barh', 'output': 'reports/by_country.png',
+     'values': [...], 'labels': [...], 'title': '...', ...}
+
+Scripts that call render_charts must guard their entry point with
+``if __name__ == "__main__":`` because worker processes may re-import them.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+# Styles shared by the analysis scripts' charts
+TITLE_STYLE = {'fontsize': 14, 'fontweight': 'bold', 'pad': 20}
+AXIS_LABEL_STYLE = {'fontsize': 12, 'fontweight': 'bold'}
+PIE_LABEL_STYLE = {'fontsize': 10, 'fontweight': 'bold'}
+PIE_PCT_STYLE = {'color': 'white', 'fontsize': 9, 'fontweight': 'bold'}
+SAVEFIG_OPTIONS = {'dpi': 300, 'bbox_inches': 'tight'}
+
+
+def _colors(spec, count):
+    """Explicit colors of a spec, or `count` colors of its seaborn palette"""
+    if 'colors' in spec:
+        return spec['colors']
+    return sns.color_palette(spec.get('palette', 'viridis'), count)
+
+
+def _axis_labels(ax, spec):
+    style = spec.get('axis_label_style', AXIS_LABEL_STYLE)
+    if 'xlabel' in spec:
+        ax.set_xlabel(spec['xlabel'], **style)
+    if 'ylabel' in spec:
+        ax.set_ylabel(spec['ylabel'], **style)
+
+
+def _draw_pie(ax, spec):
+    """Pie with styled wedge labels and percentages"""
+    values = spec['values']
+    _, texts, autotexts = ax.pie(values, labels=spec['labels'], autopct='%1.1f%%',
+                                 colors=_colors(spec, len(values)),
+                                 startangle=spec.get('startangle', 90),
+                                 **spec.get('pie_options', {}))
+    for text in texts:
+        text.set(**spec.get('label_style', PIE_LABEL_STYLE))
+    for autotext in autotexts:
+        autotext.set(**spec.get('pct_style', PIE_PCT_STYLE))
+
+
+def _barh(fig, spec):
+    """Horizontal bars, largest first, with a value label on each bar"""
+    ax = fig.add_subplot()
+    values = spec['values']
+    positions = range(len(values))
+    ax.barh(positions, values, color=_colors(spec, len(values)))
+    ax.set_yticks(positions)
+    ax.set_yticklabels(spec['labels'])
+    _axis_labels(ax, spec)
+    ax.invert_yaxis()
+
+    value_labels = spec.get('value_labels') or [f' {value:,}' for value in values]
+    for i, (value, text) in enumerate(zip(values, value_labels)):
+        ax.text(value, i, text, va='center', **spec.get('value_label_style', {'fontsize': 10}))
+    return ax
+
+
+def _bar(fig, spec):
+    """Vertical bars with the value printed above each bar"""
+    ax = fig.add_subplot()
+    values = spec['values']
+    positions = range(len(values))
+    bars = ax.bar(positions, values, color=_colors(spec, len(values)))
+    ax.set_xticks(positions)
+    ax.set_xticklabels(spec['labels'], rotation=spec.get('rotation', 45), ha='right')
+    _axis_labels(ax, spec)
+
+    for bar, value in zip(bars, values):
+        ax.text(bar.get_x() + bar.get_width() / 2., bar.get_height(), f'{int(value):,}',
+                ha='center', va='bottom', fontsize=spec.get('value_label_fontsize', 9))
+    return ax
+
+
+def _grouped_bar(fig, spec):
+    """Side-by-side bars of several series per label"""
+    ax = fig.add_subplot()
+    series = spec['series']
+    width = spec.get('width', 0.15)
+    x = np.arange(len(spec['labels']))
+    offset = (len(series) - 1) / 2
+    for idx, (name, values, color) in enumerate(series):
+        ax.bar(x + (idx - offset) * width, values, width, label=name, color=color)
+    ax.set_xticks(x)
+    ax.set_xticklabels(spec['labels'], rotation=spec.get('rotation', 45), ha='right')
+    _axis_labels(ax, spec)
+    ax.legend(loc=spec.get('legend_loc', 'upper right'))
+    return ax
+
+
+def _pie(fig, spec):
+    ax = fig.add_subplot()
+    _draw_pie(ax, spec)
+    return ax
+
+
+def _pie_grid(fig, spec):
+    """One pie per panel; panels are dicts with values, labels and title"""
+    axes = fig.subplots(*spec['grid']).flatten()
+    for ax, panel in zip(axes, spec['panels']):
+        _draw_pie(ax, {**spec, **panel, 'title': None})
+        ax.set_title(panel['title'], **spec.get('panel_title_style', {}))
+    for ax in axes[len(spec['panels']):]:
+        ax.set_visible(False)
+    return None
+
+
+def _heatmap(fig, spec):
+    """Seaborn heatmap of a 2-D array or DataFrame"""
+    ax = fig.add_subplot()
+    sns.heatmap(spec['data'], ax=ax, **spec.get('heatmap_options', {}))
+    return ax
+
+
+def _hist_grid(fig, spec):
+    """Histogram per (name, values) pair in spec['columns']"""
+    axes = fig.subplots(*spec['grid']).flatten()
+    for ax, (name, values) in zip(axes, spec['columns']):
+        ax.hist(values, bins=spec.get('bins', 30), edgecolor='black')
+        ax.set_title(f'Distribution of {name}')
+        ax.set_xlabel(name)
+        ax.set_ylabel('Frequency')
+    for ax in axes[len(spec['columns']):]:
+        ax.set_visible(False)
+    return None
+
+
+# Drawing function for each chart kind
+CHART_KINDS = {
+    'barh': _barh,
+    'bar': _bar,
+    'grouped_bar': _grouped_bar,
+    'pie': _pie,
+    'pie_grid': _pie_grid,
+    'heatmap': _heatmap,
+    'hist_grid': _hist_grid
+}
+
+
+def render_chart(spec):
+    """
+    Render one chart spec to its output file
+
+    Args:
+        spec (dict): Chart spec. Required keys are 'kind' (a key of
+            CHART_KINDS) and 'output'; optional common keys are 'figsize',
+            'title', 'title_style', 'style' (seaborn axes style) and
+            'savefig' (keyword arguments for Figure.savefig).
+
+    Returns:
+        str: Path of the written image
+    """
+    draw = CHART_KINDS[spec['kind']]
+    with sns.axes_style(spec.get('style')):
+        fig = Figure(figsize=spec.get('figsize', (12, 8)))
+        FigureCanvasAgg(fig)
+        ax = draw(fig, spec)
+        if spec.get('title') and ax is not None:
+            ax.set_title(spec['title'], **spec.get('title_style', TITLE_STYLE))
+    fig.tight_layout()
+
+    output_dir = os.path.dirname(spec['output'])
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    fig.savefig(spec['output'], **spec.get('savefig', SAVEFIG_OPTIONS))
+    return spec['output']
+
+
+def render_charts(specs, max_workers=None):
+    """
+    Render chart specs in parallel worker processes
+
+    Falls back to rendering in this process for a single chart, one worker,
+    or when no process pool can be started; charts whose worker died are
+    rendered again here. Errors raised by render_chart propagate. When called from a worker
+    process (such as a parallel pipeline stage) charts are rendered in that
+    process by default instead of starting a nested pool.
+
+    Args:
+        specs (list): Chart specs, see render_chart
+        max_workers (int): Worker processes (default: one per CPU, at most
+            one per chart; 1 inside a worker process)
+
+    Returns:
+        list: Paths of the written images, in spec order
+    """
+    specs = list(specs)
+    if max_workers is None:
+        if multiprocessing.parent_process() is not None:
+            # The CPUs are already shared by the caller's pool
+            max_workers = 1
+        else:
+            max_workers = min(len(specs), os.cpu_count() or 1)
+    if max_workers <= 1:
+        return [render_chart(spec) for spec in specs]
+
+    pool = None
+    try:
+        pool = ProcessPoolExecutor(max_workers=max_workers)
+        futures = [pool.submit(render_chart, spec) for spec in specs]
+    except (OSError, BrokenProcessPool) as e:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        print(f"⚠ Chart pool unavailable ({e}), rendering charts sequentially")
+        return [render_chart(spec) for spec in specs]
+
+    # Errors raised while rendering a chart propagate; only charts lost to a
+    # dead pool are rendered again in this process
+    paths = []
+    with pool:
+        for spec, future in zip(specs, futures):
+            try:
+                paths.append(future.result())
+            except BrokenProcessPool as e:
+                print(f"⚠ Chart pool stopped ({e}), rendering {spec['output']} sequentially")
+                paths.append(render_chart(spec))
+    return paths
@@ -0,0 +1,398 @@
+"""
+Data Profiler
+Computes per-column statistics incrementally over one or more DataFrame
+chunks, so a sheet can be profiled without holding all of its rows in memory.
+In sketch mode text columns are summarized in fixed memory as well.
+"""
+
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from sketches import DEFAULT_TOP_K, HyperLogLog, SpaceSaving
+
+# Numeric values kept per column for quartile estimation when streaming
+DEFAULT_SAMPLE_SIZE = 100000
+
+# Upper bound on the row buckets of a missing-data pattern
+DEFAULT_MISSING_BUCKETS = 500
+
+# Hash given to missing values in row_hashes (numeric zero already hashes to 0)
+_MISSING_HASH = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _is_numeric(series):
+    """True for the columns that DataFrame.describe() summarizes by default"""
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+
+def _is_categorical(series):
+    """True for text-like columns that get value counts"""
+    return _is_text_dtype(series.dtype)
+
+
+def _is_text_dtype(dtype):
+    """True for object and category dtypes"""
+    return pd.api.types.is_object_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype)
+
+
+def number_text(series):
+    """Numbers as text, whole numbers without a decimal point (3 and 3.0 both become '3')"""
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    text = pd.Series(values, index=series.index).astype('string')
+    whole = np.isfinite(values) & (np.mod(values, 1) == 0) & (np.abs(values) < 2 ** 53)
+    text[whole] = values[whole].astype(np.int64).astype(str)
+    return text
+
+
+def _merge_dtype(current, new):
+    """Combine the dtypes a column had in two different chunks"""
+    if current is None or current == new:
+        return new
+    if pd.api.types.is_numeric_dtype(current) and pd.api.types.is_numeric_dtype(new):
+        return np.result_type(current, new)
+    return np.dtype(object)
+
+
+def row_hashes(frame):
+    """
+    64-bit hash of each row that does not depend on how a chunk was parsed
+
+    Chunks infer their dtypes separately: a column read as int64 in one
+    chunk is float64 in the next if that one has a missing value, or all
+    missing (float64) in a chunk where it is text elsewhere. Numbers are
+    therefore hashed as float64 and missing values get the same hash in
+    every dtype, so equal rows hash equally in every chunk.
+
+    Args:
+        frame (pd.DataFrame): Rows to hash
+
+    Returns:
+        np.ndarray: uint64 hash per row
+    """
+    column_hashes = {}
+    for pos in range(frame.shape[1]):
+        series = frame.iloc[:, pos]
+        if _is_numeric(series):
+            series = pd.Series(series.to_numpy(dtype=np.float64, na_value=np.nan), index=series.index)
+        hashes = pd.util.hash_pandas_object(series, index=False).to_numpy()
+        column_hashes[pos] = np.where(series.isna().to_numpy(), _MISSING_HASH, hashes)
+    return pd.util.hash_pandas_object(pd.DataFrame(column_hashes, index=frame.index), index=False).to_numpy()
+
+
+class _NumericAccumulator:
+    """Running count, mean, variance, min, max and a reservoir sample of one column"""
+
+    def __init__(self, sample_size, rng):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.nan
+        self.max = np.nan
+        self.sample_size = sample_size
+        self.sample = np.empty(0)
+        self.rng = rng
+
+    def update(self, values):
+        values = values[~np.isnan(values)]
+        n = len(values)
+        if n == 0:
+            return
+
+        # Chan et al. parallel update of mean and sum of squared deviations
+        chunk_mean = values.mean()
+        chunk_m2 = ((values - chunk_mean) ** 2).sum()
+        total = self.count + n
+        delta = chunk_mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += chunk_m2 + delta ** 2 * self.count * n / total
+        self.min = np.nanmin([self.min, values.min()])
+        self.max = np.nanmax([self.max, values.max()])
+        self._update_sample(values)
+        self.count = total
+
+    def _update_sample(self, values):
+        if self.sample_size is None:
+            self.sample = np.concatenate([self.sample, values])
+            return
+
+        # Vectorized reservoir sampling (Algorithm R)
+        free = max(self.sample_size - len(self.sample), 0)
+        if free:
+            self.sample = np.concatenate([self.sample, values[:free]])
+        rest = values[free:]
+        if len(rest) == 0:
+            return
+        positions = self.count + free + np.arange(len(rest))
+        slots = self.rng.integers(0, positions + 1)
+        accepted = slots < self.sample_size
+        self.sample[slots[accepted]] = rest[accepted]
+
+    def summary(self):
+        if self.count == 0:
+            return {'count': 0.0, 'mean': np.nan, 'std': np.nan, 'min': np.nan,
+                    '25%': np.nan, '50%': np.nan, '75%': np.nan, 'max': np.nan}
+        q25, q50, q75 = np.percentile(self.sample, [25, 50, 75])
+        std = np.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else np.nan
+        return {
+            'count': float(self.count),
+            'mean': self.mean,
+            'std': std,
+            'min': self.min,
+            '25%': q25,
+            '50%': q50,
+            '75%': q75,
+            'max': self.max
+        }
+
+
+class DataProfiler:
+    """Accumulates dataset statistics chunk by chunk"""
+
+    def __init__(self, sample_size=DEFAULT_SAMPLE_SIZE, seed=0, sketch=False, top_k=DEFAULT_TOP_K):
+        """
+        Initialize an empty profile
+
+        Args:
+            sample_size (int): Numeric values kept per column for quartiles.
+                None keeps every value, which makes quartiles exact.
+            seed (int): Seed for the reservoir sampler
+            sketch (bool): Summarize text columns with fixed-size sketches
+                (HyperLogLog distinct counts, Space-Saving top values)
+                instead of exact value counts
+            top_k (int): Frequent values kept per text column in sketch mode
+        """
+        self.sample_size = sample_size
+        self.sketch = sketch
+        self.top_k = top_k
+        self.rng = np.random.default_rng(seed)
+        self.total_rows = 0
+        self.columns = []
+        self.dtypes = {}
+        self.missing = {}
+        self.memory_bytes = 0
+        self.duplicate_rows = 0
+        self._seen_hashes = np.empty(0, dtype=np.uint64)
+        self._numeric = {}
+        self._counts = {}
+        self._number_counts = {}
+        self._sketches = {}
+
+    def update(self, chunk):
+        """
+        Add a chunk of rows to the profile
+
+        Chunks infer their dtypes separately, so a column can be numeric in
+        some chunks and text in others (e.g. phone numbers). The values of
+        numeric chunks are counted as well, and if the column turns out to
+        be text they are reported as text like the in-memory loader does:
+
+        >>> profiler = DataProfiler()
+        >>> profiler.update(pd.DataFrame({'Code': [7, 8, 8]}))
+        >>> profiler.update(pd.DataFrame({'Code': ['A1', '7', None]}))
+        >>> profiler.categorical_summary()['Code']['frequency']
+        {'7': 2, '8': 2, 'A1': 1}
+        >>> sketched = DataProfiler(sketch=True)
+        >>> sketched.update(pd.DataFrame({'Code': [7, 8, 8]}))
+        >>> sketched.update(pd.DataFrame({'Code': ['A1', '7', None]}))
+        >>> sketched.categorical_summary()['Code']['unique_values']
+        3
+
+        Args:
+            chunk (pd.DataFrame): Next rows of the dataset
+        """
+        if not self.columns:
+            self.columns = list(chunk.columns)
+            self.missing = {col: 0 for col in self.columns}
+
+        chunk_missing = chunk.isnull().sum()
+        for col, count in chunk_missing.items():
+            self.missing[col] += int(count)
+        self.memory_bytes += int(chunk.memory_usage(deep=True).sum())
+        self._update_duplicates(chunk)
+
+        for col in self.columns:
+            series = chunk[col]
+            if chunk_missing[col] < len(chunk) or col not in self.dtypes:
+                self.dtypes[col] = _merge_dtype(self.dtypes.get(col), series.dtype)
+
+            if _is_numeric(series):
+                if col not in self._numeric:
+                    self._numeric[col] = _NumericAccumulator(self.sample_size, self.rng)
+                self._numeric[col].update(series.to_numpy(dtype=float, na_value=np.nan))
+                self._update_number_counts(col, series)
+            elif _is_categorical(series) and self.sketch:
+                self._update_sketches(col, series)
+            elif _is_categorical(series):
+                counts = self._counts.setdefault(col, Counter())
+                for value, count in series.value_counts().items():
+                    if count:
+                        counts[value] += int(count)
+
+        self.total_rows += len(chunk)
+
+    def _update_sketches(self, col, series):
+        if col not in self._sketches:
+            self._sketches[col] = (HyperLogLog(), SpaceSaving(self.top_k))
+        distinct, frequent = self._sketches[col]
+        distinct.update(series)
+        frequent.update(series)
+
+    def _update_number_counts(self, col, series):
+        """
+        Count the values of a numeric chunk in case the column is text elsewhere
+
+        In sketch mode they go into the column's sketches as text. Exact
+        counts are kept by number and only converted to text when a text
+        chunk of the column shows up in categorical_summary.
+        """
+        if self.sketch:
+            self._update_sketches(col, number_text(series))
+            return
+        counts = series.value_counts()
+        counts.index = counts.index.astype(np.float64)
+        if col in self._number_counts:
+            counts = self._number_counts[col].add(counts, fill_value=0)
+        self._number_counts[col] = counts
+
+    def _update_duplicates(self, chunk):
+        """
+        Count rows whose 64-bit row hash was already seen
+
+        The hashes seen so far are kept sorted, so a chunk is looked up with
+        a binary search and its new hashes are inserted in one pass. Unlike
+        the other statistics this state grows with the number of distinct
+        rows (8 bytes each).
+        """
+        hashes = row_hashes(chunk)
+        repeated = pd.Series(hashes).duplicated().to_numpy()
+        seen = self._seen_hashes
+        positions = np.searchsorted(seen, hashes)
+        if len(seen):
+            repeated |= seen[np.minimum(positions, len(seen) - 1)] == hashes
+        self.duplicate_rows += int(repeated.sum())
+
+        new = np.unique(hashes[~repeated])
+        self._seen_hashes = np.insert(seen, np.searchsorted(seen, new), new)
+
+    def basic_info(self):
+        """Basic dataset information in the format of ExcelAnalyzer.get_basic_info"""
+        return {
+            'total_rows': self.total_rows,
+            'total_columns': len(self.columns),
+            'column_names': list(self.columns),
+            'data_types': dict(self.dtypes),
+            'missing_values': dict(self.missing),
+            'memory_usage': self.memory_bytes / 1024**2  # MB
+        }
+
+    def missing_data(self):
+        """Missing value counts in the format of ExcelAnalyzer.analyze_missing_data"""
+        rows = self.total_rows or np.nan
+        return {
+            'total_missing': sum(self.missing.values()),
+            'missing_by_column': dict(self.missing),
+            'missing_percentage': {col: count / rows * 100 for col, count in self.missing.items()}
+        }
+
+    def duplicates(self):
+        """Duplicate row counts in the format of ExcelAnalyzer.find_duplicates"""
+        return {
+            'total_duplicates': self.duplicate_rows,
+            'duplicate_percentage': (self.duplicate_rows / self.total_rows) * 100 if self.total_rows else 0.0
+        }
+
+    def numeric_summary(self):
+        """describe()-style statistics for numerical columns"""
+        return {
+            col: acc.summary()
+            for col, acc in self._numeric.items()
+            if _is_numeric(pd.Series(dtype=self.dtypes[col]))
+        }
+
+    def describe_frame(self):
+        """Numerical summary as a DataFrame laid out like DataFrame.describe()"""
+        return pd.DataFrame(self.numeric_summary())
+
+    def categorical_summary(self):
+        """
+        Unique counts, most frequent value and frequencies for text columns
+
+        In sketch mode unique_values is a HyperLogLog estimate and frequency
+        holds only the top_k most frequent values with estimated counts;
+        'approximate' tells the two modes apart.
+        """
+        summary = {}
+        for col in self.columns:
+            if col not in self._counts and col not in self._number_counts:
+                continue
+            if not _is_text_dtype(self.dtypes[col]):
+                continue
+            counts = Counter(self._counts.get(col))
+            numbers = self._number_counts.get(col)
+            if numbers is not None:
+                for value, count in zip(number_text(numbers.index.to_series()), numbers.to_numpy()):
+                    counts[value] += int(count)
+            frequency = dict(counts.most_common())
+            summary[col] = {
+                'unique_values': len(counts),
+                'top_value': _top_value(counts),
+                'frequency': frequency,
+                'approximate': False
+            }
+        for col, (distinct, frequent) in self._sketches.items():
+            if not _is_text_dtype(self.dtypes[col]):
+                continue
+            frequency = frequent.top().to_dict()
+            summary[col] = {
+                'unique_values': distinct.count(),
+                'top_value': _top_value(frequency),
+                'frequency': frequency,
+                'approximate': True
+            }
+        return summary
+
+
+def _top_value(counts):
+    """Most frequent value, breaking ties by the smallest value like Series.mode()"""
+    if not counts:
+        return None
+    best = max(counts.values())
+    tied = [value for value, count in counts.items() if count == best]
+    try:
+        return min(tied)
+    except TypeError:
+        return tied[0]
+
+
+def missing_pattern(df, max_buckets=DEFAULT_MISSING_BUCKETS):
+    """
+    Fraction of missing values per column in consecutive row buckets
+
+    Rows are split into at most max_buckets contiguous, near-equal buckets,
+    so the result (and any heatmap drawn from it) has a bounded size however
+    long the frame is. With no more rows than buckets every bucket is a
+    single row and the pattern is exact.
+
+    Args:
+        df (pd.DataFrame): Data to summarize
+        max_buckets (int): Maximum number of row buckets
+
+    Returns:
+        pd.DataFrame: Bucket x column missing fractions in [0, 1], indexed
+            by the (1-based) first row of each bucket
+    """
+    n_rows = len(df)
+    n_buckets = max(1, min(max_buckets, n_rows))
+    starts = np.arange(n_buckets) * n_rows // n_buckets
+    sizes = np.diff(np.append(starts, n_rows))
+    if n_rows == 0:
+        return pd.DataFrame(index=pd.Index([], name='First Row'), columns=df.columns, dtype=float)
+
+    # One column at a time keeps the temporary null mask to a single column
+    fractions = np.empty((n_buckets, len(df.columns)))
+    for idx in range(len(df.columns)):
+        nulls = df.iloc[:, idx].isna().to_numpy()
+        fractions[:, idx] = np.add.reduceat(nulls, starts, dtype=np.int64) / sizes
+    return pd.DataFrame(fractions, index=pd.Index(starts + 1, name='First Row'), columns=df.columns)
@@ -0,0 +1,180 @@
+"""
+Duplicate Detection
+Finds duplicate leads by key columns instead of whole rows. Key values are
+normalized (trimmed, case-folded, runs of whitespace collapsed) and hashed
+into 64-bit fingerprints chunk by chunk; rows sharing a fingerprint form a
+duplicate cluster. Only the fingerprints and row labels are kept, so the
+detection scales to exports far larger than the rows that fit in memory.
+"""
+
+import numpy as np
+import pandas as pd
+
+from data_profiler import number_text
+from lead_data_loader import DEFAULT_CHUNK_SIZE
+
+# Key columns used when none are given, e.g. ['Company Name', 'First Name', 'Last Name']
+DEFAULT_KEY_COLUMNS = ['Email']
+
+
+def _is_text(series):
+    return (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)
+            or isinstance(series.dtype, pd.CategoricalDtype))
+
+
+def _is_number(series):
+    return pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series)
+
+
+def normalize_keys(frame):
+    """
+    Normalize key columns so that trivially different spellings match
+
+    Text is stripped, case-folded and has runs of whitespace collapsed, and
+    empty strings count as missing. Numeric columns are converted to text
+    first: chunks infer their dtypes separately, so the same key can be
+    int64 in one chunk, float64 in the next (a missing value) and text in a
+    third, and all of them must give the same fingerprint.
+
+    Args:
+        frame (pd.DataFrame): Key columns of a chunk
+
+    Returns:
+        pd.DataFrame: Normalized key columns with the same index
+    """
+    normalized = {}
+    for col in frame.columns:
+        series = frame[col]
+        if _is_number(series):
+            series = number_text(series)
+        if _is_text(series):
+            text = series.astype('string').str.strip().str.casefold().str.replace(r'\s+', ' ', regex=True)
+            series = text.mask(text == '')
+        normalized[col] = series
+    return pd.DataFrame(normalized, index=frame.index)
+
+
+def key_fingerprints(frame):
+    """
+    Hash the normalized key columns of each row into a 64-bit fingerprint
+
+    Args:
+        frame (pd.DataFrame): Key columns of a chunk
+
+    Returns:
+        tuple: (np.ndarray of uint64 fingerprints, np.ndarray of bool that is
+            False for rows whose key columns are all missing)
+    """
+    normalized = normalize_keys(frame)
+    fingerprints = pd.util.hash_pandas_object(normalized, index=False).to_numpy()
+    return fingerprints, normalized.notna().any(axis=1).to_numpy()
+
+
+class DuplicateDetector:
+    """Groups rows with equal normalized key columns, one chunk at a time"""
+
+    def __init__(self, key_columns=None):
+        """
+        Initialize an empty detector
+
+        Args:
+            key_columns (list): Columns identifying a lead (default: every column)
+        """
+        self.key_columns = list(key_columns) if key_columns is not None else None
+        self.total_rows = 0
+        self._fingerprints = []
+        self._labels = []
+
+    def update(self, chunk):
+        """
+        Add a chunk of rows
+
+        Rows whose key columns are all missing never count as duplicates.
+
+        Args:
+            chunk (pd.DataFrame): Next rows of the dataset; its index labels
+                identify the rows in the clusters
+        """
+        if self.key_columns is not None:
+            missing = [col for col in self.key_columns if col not in chunk.columns]
+            if missing:
+                raise ValueError(f"Key column(s) not in the data: {', '.join(missing)}")
+            chunk = chunk[self.key_columns]
+
+        fingerprints, has_key = key_fingerprints(chunk)
+        self._fingerprints.append(fingerprints[has_key])
+        self._labels.append(chunk.index.to_numpy()[has_key])
+        self.total_rows += len(chunk)
+
+    def clusters(self):
+        """
+        Rows that share their key with at least one other row
+
+        Returns:
+            pd.Series: Cluster number (1, 2, ... in order of first occurrence)
+                indexed by row label, sorted by cluster and then row order
+        """
+        fingerprints = np.concatenate(self._fingerprints) if self._fingerprints else np.empty(0, dtype=np.uint64)
+        labels = np.concatenate(self._labels) if self._labels else np.empty(0, dtype=np.int64)
+
+        # A stable sort keeps the rows of each cluster in their original order
+        order = np.argsort(fingerprints, kind='stable')
+        sorted_fingerprints = fingerprints[order]
+        starts = np.flatnonzero(np.r_[True, sorted_fingerprints[1:] != sorted_fingerprints[:-1]])
+        sizes = np.diff(np.r_[starts, len(order)])
+
+        repeated = sizes > 1
+        starts, sizes = starts[repeated], sizes[repeated]
+        # Number the clusters by the position of their first row
+        first_rows = order[starts]
+        rank = np.empty(len(starts), dtype=np.int64)
+        rank[np.argsort(first_rows, kind='stable')] = np.arange(1, len(starts) + 1)
+
+        positions = np.concatenate([order[start:start + size] for start, size in zip(starts, sizes)]) \
+            if len(starts) else np.empty(0, dtype=np.int64)
+        cluster_ids = np.repeat(rank, sizes)
+        result = pd.Series(cluster_ids, index=labels[positions], name='Cluster')
+        sort_order = np.lexsort((positions, cluster_ids))
+        return result.iloc[sort_order]
+
+    def summary(self, clusters=None):
+        """
+        Duplicate counts in the format of ExcelAnalyzer.find_duplicates
+
+        Every row of a cluster except the first counts as a duplicate.
+
+        Args:
+            clusters (pd.Series): Result of clusters(), if already computed
+
+        Returns:
+            dict: total_duplicates, duplicate_percentage, duplicate_clusters
+                and key_columns
+        """
+        if clusters is None:
+            clusters = self.clusters()
+        cluster_count = int(clusters.nunique())
+        duplicates = len(clusters) - cluster_count
+        return {
+            'total_duplicates': duplicates,
+            'duplicate_percentage': (duplicates / self.total_rows) * 100 if self.total_rows else 0.0,
+            'duplicate_clusters': cluster_count,
+            'key_columns': self.key_columns
+        }
+
+
+def detect_duplicates(df, key_columns=DEFAULT_KEY_COLUMNS, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Run duplicate detection over an in-memory DataFrame in chunks
+
+    Args:
+        df (pd.DataFrame): Lead data
+        key_columns (list): Columns identifying a lead; None for every column
+        chunk_size (int): Rows normalized and hashed at a time
+
+    Returns:
+        DuplicateDetector: Detector holding the fingerprints of every row
+    """
+    detector = DuplicateDetector(key_columns)
+    for start in range(0, len(df), chunk_size):
+        detector.update(df.iloc[start:start + chunk_size])
+    return detector
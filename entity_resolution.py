@@ -0,0 +1,244 @@
+"""
+Entity Resolution
+Clusters near-duplicate company names ("Acme GmbH", "ACME Gmbh.", "Acme")
+and assigns every lead a canonical Company ID. Names are normalized first,
+so most variants collapse to the same key; the remaining keys are only
+compared with their neighbours in sorted order (sorted-neighbourhood
+blocking), never pairwise, and matches are merged with union-find.
+Two names only match if they also agree word by word, so "Bank of India"
+and "Bank of Indiana" stay different companies.
+"""
+
+from difflib import SequenceMatcher
+
+import numpy as np
+import pandas as pd
+
+from result_cache import tag_fingerprint
+
+# Legal-form suffixes dropped from the end of a company name
+LEGAL_SUFFIXES = {
+    'ag', 'bv', 'co', 'company', 'corp', 'corporation', 'gmbh', 'inc', 'incorporated',
+    'limited', 'llc', 'llp', 'ltd', 'nv', 'plc', 'private', 'pte', 'pvt', 'sa', 'sarl', 'srl'
+}
+
+# Minimum SequenceMatcher ratio for two normalized names to be merged
+DEFAULT_SIMILARITY = 0.9
+
+# Number of sorted neighbours each normalized name is compared with
+DEFAULT_WINDOW = 5
+
+
+def normalize_company_names(names):
+    """
+    Reduce company names to comparison keys
+
+    Keys are case-folded, stripped of punctuation and of trailing legal
+    forms (GmbH, Inc, Ltd, ...). A name made up only of a legal form keeps it.
+
+    Args:
+        names (pd.Series): Company names
+
+    Returns:
+        pd.Series: Normalized keys, missing where the name is missing or empty
+    """
+    text = names.astype('string').str.casefold().str.replace(r'[^\w\s]', ' ', regex=True)
+    tokens = text.str.split()
+
+    def strip_suffixes(words):
+        if not isinstance(words, list):
+            return pd.NA
+        end = len(words)
+        while end > 1 and words[end - 1] in LEGAL_SUFFIXES:
+            end -= 1
+        return ' '.join(words[:end]) or pd.NA
+
+    return tokens.map(strip_suffixes).astype('string')
+
+
+def tokens_agree(a, b):
+    """
+    True if two normalized names differ only inside their words
+
+    The names must have the same words, except for typos inside a word: a
+    differing word pair must keep its first and last letter, and neither
+    word may extend the other (a difference at a word boundary). Names that
+    are equal once spaces are removed also agree.
+
+    Args:
+        a (str): Normalized name
+        b (str): Normalized name
+
+    Returns:
+        bool: True if the names may be spellings of the same company
+    """
+    words_a, words_b = a.split(), b.split()
+    if len(words_a) != len(words_b):
+        return ''.join(words_a) == ''.join(words_b)
+    for word_a, word_b in zip(words_a, words_b):
+        if word_a == word_b:
+            continue
+        if word_a[0] != word_b[0] or word_a[-1] != word_b[-1]:
+            return False
+        if word_a.startswith(word_b) or word_b.startswith(word_a) or \
+                word_a.endswith(word_b) or word_b.endswith(word_a):
+            return False
+    return True
+
+
+def _similar(matcher, threshold):
+    """Full SequenceMatcher ratio check, after the cheap upper bounds rule out most pairs"""
+    return (matcher.real_quick_ratio() >= threshold and matcher.quick_ratio() >= threshold
+            and matcher.ratio() >= threshold)
+
+
+def names_match(a, b, threshold=DEFAULT_SIMILARITY):
+    """
+    Decide whether two normalized names belong to the same company
+
+    Near misses that differ at a word boundary are kept apart:
+
+    >>> names_match('bank of india', 'bank of indiana')
+    False
+    >>> names_match('bank of india', 'bank of china')
+    False
+    >>> names_match('tata consultancy services', 'tata consultancy service')
+    False
+    >>> names_match('accenture consulting', 'accenture consluting')
+    True
+    >>> names_match('siemens healthineers', 'siemens healthinears')
+    True
+    >>> names_match('data soft', 'datasoft')
+    True
+
+    Args:
+        a (str): Normalized name
+        b (str): Normalized name
+        threshold (float): Minimum similarity ratio for a match
+
+    Returns:
+        bool: True if the names match
+    """
+    return tokens_agree(a, b) and _similar(SequenceMatcher(None, a, b, autojunk=False), threshold)
+
+
+class _UnionFind:
+    """Disjoint sets over 0..n-1 with path halving"""
+
+    def __init__(self, size):
+        self.parent = np.arange(size)
+
+    def find(self, item):
+        parent = self.parent
+        while parent[item] != item:
+            parent[item] = parent[parent[item]]
+            item = parent[item]
+        return item
+
+    def union(self, a, b):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+def cluster_keys(keys, threshold=DEFAULT_SIMILARITY, window=DEFAULT_WINDOW):
+    """
+    Cluster distinct normalized names with sorted-neighbourhood blocking
+
+    Keys are sorted twice, as written and reversed, so that names differing
+    near their start still end up next to each other. Each key is compared
+    with the following window - 1 keys of each ordering, and two keys are
+    merged if they match by names_match.
+
+    Args:
+        keys (list): Distinct normalized names
+        threshold (float): Minimum similarity ratio for a match
+        window (int): Size of the sliding comparison window
+
+    Returns:
+        np.ndarray: Cluster representative (an index into keys) per key
+    """
+    clusters = _UnionFind(len(keys))
+    # SequenceMatcher indexes its second sequence, so that is the reused one
+    matcher = SequenceMatcher(None, autojunk=False)
+    for sort_key in (lambda i: keys[i], lambda i: keys[i][::-1]):
+        ordered = sorted(range(len(keys)), key=sort_key)
+        for pos, current in enumerate(ordered):
+            matcher.set_seq2(keys[current])
+            for other in ordered[pos + 1:pos + window]:
+                if clusters.find(current) == clusters.find(other):
+                    continue
+                if not tokens_agree(keys[current], keys[other]):
+                    continue
+                matcher.set_seq1(keys[other])
+                if _similar(matcher, threshold):
+                    clusters.union(current, other)
+    return np.array([clusters.find(i) for i in range(len(keys))], dtype=np.int64)
+
+
+def resolve_companies(names, threshold=DEFAULT_SIMILARITY, window=DEFAULT_WINDOW):
+    """
+    Assign a canonical company to every name
+
+    Names are normalized and compared once per distinct spelling, so the
+    cost grows with the number of spellings rather than with the row count.
+
+    Args:
+        names (pd.Series): Company name per lead
+        threshold (float): Minimum similarity ratio for a match
+        window (int): Size of the sorted-neighbourhood window
+
+    Returns:
+        pd.DataFrame: 'Company ID' (numbered by first occurrence, missing for
+            leads without a name) and 'Company' (the most common spelling in
+            the cluster), indexed like names
+    """
+    # Normalize and cluster each distinct spelling once; -1 marks a missing name
+    name_codes, spellings = pd.factorize(names)
+    key_codes, keys = pd.factorize(normalize_company_names(pd.Series(spellings, dtype=object)))
+    representative = cluster_keys(list(keys), threshold, window)
+    spelling_cluster = np.append(representative, -1)[key_codes]
+    row_cluster = np.append(spelling_cluster, -1)[name_codes]
+
+    # Number the clusters in order of their first lead
+    named = row_cluster >= 0
+    cluster_ids, first_seen = np.unique(row_cluster[named], return_index=True)
+    numbering = np.empty(len(cluster_ids), dtype=np.int64)
+    numbering[np.argsort(first_seen, kind='stable')] = np.arange(1, len(cluster_ids) + 1)
+
+    company_id = pd.Series(pd.NA, index=names.index, dtype='Int64')
+    company_id[named] = numbering[np.searchsorted(cluster_ids, row_cluster[named])]
+
+    # Canonical spelling: the most frequent original name of each cluster
+    spellings = pd.DataFrame({'id': company_id, 'name': names.astype('string')}).dropna()
+    canonical = (spellings.value_counts(sort=True).reset_index()
+                 .drop_duplicates('id').set_index('id')['name'])
+
+    return pd.DataFrame({
+        'Company ID': company_id,
+        'Company': company_id.map(canonical).astype('string')
+    }, index=names.index)
+
+
+def add_company_ids(df, column='Company Name', threshold=DEFAULT_SIMILARITY, window=DEFAULT_WINDOW):
+    """
+    Add the 'Company ID' and canonical 'Company' columns in place
+
+    Downstream aggregations should count and group companies by
+    'Company ID' instead of the raw name.
+
+    Args:
+        df (pd.DataFrame): Lead data
+        column (str): Column holding the company name
+        threshold (float): Minimum similarity ratio for a match
+        window (int): Size of the sorted-neighbourhood window
+
+    Returns:
+        pd.DataFrame: The same frame, for chaining
+    """
+    resolved = resolve_companies(df[column], threshold, window)
+    df['Company ID'] = resolved['Company ID']
+    df['Company'] = resolved['Company']
+    tag_fingerprint(df, None)
+    print(f"✓ Resolved {df[column].nunique():,} company names to {resolved['Company ID'].nunique():,} companies")
+    return df
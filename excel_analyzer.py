@@ -5,11 +5,16 @@ This program reads Excel files, performs data analysis, and generates customized
 
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from datetime import datetime
 import os
 
+from chart_renderer import render_charts
+from data_profiler import DEFAULT_MISSING_BUCKETS, DataProfiler, missing_pattern
+from duplicate_detection import DEFAULT_KEY_COLUMNS, DuplicateDetector, detect_duplicates
+from excel_export import ExcelExport
+from html_report import write_report
+from lead_data_loader import DEFAULT_CHUNK_SIZE, iter_lead_chunks, load_lead_data
+
 
 class ExcelAnalyzer:
     """Class to analyze Excel data and generate reports"""
@@ -23,60 +28,118 @@ class ExcelAnalyzer:
         """
         self.file_path = file_path
         self.df = None
+        self.stream_profile = None
+        self._stream_sheet = 0
+        self._stream_chunk_size = DEFAULT_CHUNK_SIZE
+        self.sketch = False
         self.report = {}
-        
-    def load_data(self, sheet_name=0):
+    
+    @property
+    def df(self):
+        """The loaded dataset. Assigning a new frame discards the memoized profile."""
+        return self._df
+    
+    @df.setter
+    def df(self, value):
+        self._df = value
+        self._profile = None
+        self._duplicate_detectors = {}
+        
+    def load_data(self, sheet_name=0, use_cache=True, streaming=False, chunk_size=DEFAULT_CHUNK_SIZE,
+                  sketch=None, columns=None, dtype=None):
         """
         Load data from Excel file
         
         Args:
             sheet_name: Sheet name or index to load (default: 0)
+            use_cache (bool): Reuse the columnar cache of the workbook (default: True)
+            streaming (bool): Profile the sheet in chunks instead of keeping it in
+                memory. Only get_basic_info, get_statistical_summary,
+                find_duplicates and analyze_missing_data are available then, and
+                find_duplicates with key columns reads the sheet again.
+            chunk_size (int): Rows per chunk in streaming mode
+            sketch (bool): Summarize text columns with fixed-size sketches
+                (approximate unique counts and top values) instead of exact
+                value counts. Default: sketches when streaming, exact otherwise.
+            columns (list): Columns to load (default: all). Only these are read
+                from the cache or parsed from the sheet.
+            dtype (dict): Column -> dtype of the loaded columns
         """
+        self.sketch = streaming if sketch is None else sketch
         try:
-            self.df = pd.read_excel(self.file_path, sheet_name=sheet_name)
+            if streaming:
+                profiler = DataProfiler(sketch=self.sketch)
+                for chunk in iter_lead_chunks(self.file_path, sheet_name=sheet_name, chunk_size=chunk_size,
+                                              columns=columns, dtype=dtype):
+                    profiler.update(chunk)
+                self.df = None
+                self.stream_profile = profiler
+                self._stream_sheet = sheet_name
+                self._stream_chunk_size = chunk_size
+                rows, cols = profiler.total_rows, len(profiler.columns)
+            else:
+                self.df = load_lead_data(self.file_path, sheet_name=sheet_name, use_cache=use_cache,
+                                         columns=columns, dtype=dtype)
+                self.stream_profile = None
+                rows, cols = self.df.shape
             print(f"✓ Successfully loaded data from {self.file_path}")
-            print(f"  Shape: {self.df.shape[0]} rows × {self.df.shape[1]} columns")
+            print(f"  Shape: {rows} rows × {cols} columns")
             return True
         except Exception as e:
             print(f"✗ Error loading file: {e}")
             return False
     
+    def _get_profile(self):
+        """
+        Return the dataset profile, computing it in a single pass on first use
+        
+        All reporting methods read from this profile, so the full-table scans
+        (missing counts, describe, duplicates, memory usage) run once per
+        dataset. Call invalidate_profile() after modifying self.df in place.
+        """
+        if self.stream_profile is not None:
+            return self.stream_profile
+        if not self._check_loaded():
+            return None
+        if self._profile is None:
+            profiler = DataProfiler(sample_size=None, sketch=self.sketch)
+            profiler.update(self.df)
+            self._profile = profiler
+        return self._profile
+    
+    def invalidate_profile(self):
+        """Discard the memoized profile after an in-place change to self.df"""
+        self._profile = None
+        self._duplicate_detectors = {}
+    
+    def _check_loaded(self):
+        """Return True if the full dataset is in memory, printing why not otherwise"""
+        if self.df is not None:
+            return True
+        if self.stream_profile is not None:
+            print("Not available in streaming mode. Load data with streaming=False.")
+        else:
+            print("No data loaded. Please load data first.")
+        return False
+    
     def get_basic_info(self):
         """Get basic information about the dataset"""
-        if self.df is None:
-            print("No data loaded. Please load data first.")
+        profile = self._get_profile()
+        if profile is None:
             return
         
-        info = {
-            'total_rows': len(self.df),
-            'total_columns': len(self.df.columns),
-            'column_names': list(self.df.columns),
-            'data_types': self.df.dtypes.to_dict(),
-            'missing_values': self.df.isnull().sum().to_dict(),
-            'memory_usage': self.df.memory_usage(deep=True).sum() / 1024**2  # MB
-        }
-        
+        info = profile.basic_info()
         self.report['basic_info'] = info
         return info
     
     def get_statistical_summary(self):
         """Get statistical summary of numerical columns"""
-        if self.df is None:
-            print("No data loaded. Please load data first.")
+        profile = self._get_profile()
+        if profile is None:
             return
         
-        # Numerical columns summary
-        numeric_summary = self.df.describe().to_dict()
-        
-        # Categorical columns summary
-        categorical_cols = self.df.select_dtypes(include=['object']).columns
-        categorical_summary = {}
-        for col in categorical_cols:
-            categorical_summary[col] = {
-                'unique_values': self.df[col].nunique(),
-                'top_value': self.df[col].mode()[0] if len(self.df[col].mode()) > 0 else None,
-                'frequency': self.df[col].value_counts().to_dict()
-            }
+        numeric_summary = profile.numeric_summary()
+        categorical_summary = profile.categorical_summary()
         
         self.report['numerical_summary'] = numeric_summary
         self.report['categorical_summary'] = categorical_summary
@@ -86,40 +149,67 @@ class ExcelAnalyzer:
             'categorical': categorical_summary
         }
     
-    def find_duplicates(self):
-        """Find duplicate rows in the dataset"""
-        if self.df is None:
-            print("No data loaded. Please load data first.")
-            return
+    def find_duplicates(self, key_columns=None):
+        """
+        Find duplicate rows in the dataset
         
-        duplicates = self.df[self.df.duplicated()]
-        duplicate_info = {
-            'total_duplicates': len(duplicates),
-            'duplicate_percentage': (len(duplicates) / len(self.df)) * 100
-        }
+        Args:
+            key_columns (list): Columns identifying a lead, e.g. ['Email'] or
+                ['Company Name', 'First Name', 'Last Name']. Key values are
+                compared after trimming and case-folding, and the result also
+                holds the duplicate clusters. None compares whole rows exactly.
+        """
+        if key_columns is None:
+            profile = self._get_profile()
+            if profile is None:
+                return
+            duplicate_info = profile.duplicates()
+        else:
+            detector = self._detect_duplicates(key_columns)
+            if detector is None:
+                return
+            clusters = detector.clusters()
+            duplicate_info = detector.summary(clusters)
+            duplicate_info['clusters'] = clusters
         
         self.report['duplicates'] = duplicate_info
         return duplicate_info
     
+    def _detect_duplicates(self, key_columns):
+        """
+        Run key-based duplicate detection on the loaded data or, in streaming
+        mode, on the sheet; the detector is memoized like the profile
+        """
+        key = None if key_columns is None else tuple(key_columns)
+        if key in self._duplicate_detectors:
+            return self._duplicate_detectors[key]
+        if self.df is not None:
+            detector = detect_duplicates(self.df, key_columns)
+        elif self.stream_profile is None:
+            self._check_loaded()
+            return None
+        else:
+            # Only the key columns are parsed when the sheet is read again
+            detector = DuplicateDetector(key_columns)
+            for chunk in iter_lead_chunks(self.file_path, sheet_name=self._stream_sheet,
+                                          chunk_size=self._stream_chunk_size, columns=key_columns):
+                detector.update(chunk)
+        self._duplicate_detectors[key] = detector
+        return detector
+    
     def analyze_missing_data(self):
         """Analyze missing data patterns"""
-        if self.df is None:
-            print("No data loaded. Please load data first.")
+        profile = self._get_profile()
+        if profile is None:
             return
         
-        missing_data = {
-            'total_missing': self.df.isnull().sum().sum(),
-            'missing_by_column': self.df.isnull().sum().to_dict(),
-            'missing_percentage': (self.df.isnull().sum() / len(self.df) * 100).to_dict()
-        }
-        
+        missing_data = profile.missing_data()
         self.report['missing_data'] = missing_data
         return missing_data
     
     def get_correlation_matrix(self):
         """Calculate correlation matrix for numerical columns"""
-        if self.df is None:
-            print("No data loaded. Please load data first.")
+        if not self._check_loaded():
             return
         
         numeric_df = self.df.select_dtypes(include=[np.number])
@@ -131,268 +221,210 @@ class ExcelAnalyzer:
             print("Not enough numerical columns for correlation analysis.")
             return None
     
-    def generate_visualizations(self, output_dir='reports'):
-        """Generate visualization charts"""
-        if self.df is None:
-            print("No data loaded. Please load data first.")
+    def generate_visualizations(self, output_dir='reports', missing_buckets=DEFAULT_MISSING_BUCKETS):
+        """
+        Generate visualization charts
+        
+        Args:
+            output_dir (str): Directory for the chart images
+            missing_buckets (int): Maximum row buckets in the missing data heatmap;
+                each cell shows the fraction of missing values in its bucket
+        """
+        if not self._check_loaded():
             return
         
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
         
-        # Set style
-        sns.set_style("whitegrid")
-        
-        # 1. Missing data heatmap
-        if self.df.isnull().sum().sum() > 0:
-            plt.figure(figsize=(12, 6))
-            sns.heatmap(self.df.isnull(), cbar=True, yticklabels=False, cmap='viridis')
-            plt.title('Missing Data Heatmap')
-            plt.tight_layout()
-            plt.savefig(f'{output_dir}/missing_data_heatmap.png', dpi=300)
-            plt.close()
+        charts = []
+        
+        # 1. Missing data heatmap (rows binned, so its size does not grow with the data)
+        if self._get_profile().missing_data()['total_missing'] > 0:
+            charts.append({
+                'kind': 'heatmap',
+                'output': f'{output_dir}/missing_data_heatmap.png',
+                'figsize': (12, 6),
+                'data': missing_pattern(self.df, max_buckets=missing_buckets),
+                'heatmap_options': {'cbar': True, 'yticklabels': False, 'cmap': 'viridis',
+                                    'vmin': 0, 'vmax': 1,
+                                    'cbar_kws': {'label': 'Fraction missing'}},
+                'title': 'Missing Data Heatmap'
+            })
         
         # 2. Correlation heatmap for numerical columns
         numeric_df = self.df.select_dtypes(include=[np.number])
         if len(numeric_df.columns) > 1:
-            plt.figure(figsize=(10, 8))
-            sns.heatmap(numeric_df.corr(), annot=True, cmap='coolwarm', center=0, fmt='.2f')
-            plt.title('Correlation Matrix')
-            plt.tight_layout()
-            plt.savefig(f'{output_dir}/correlation_heatmap.png', dpi=300)
-            plt.close()
+            charts.append({
+                'kind': 'heatmap',
+                'output': f'{output_dir}/correlation_heatmap.png',
+                'figsize': (10, 8),
+                'data': numeric_df.corr(),
+                'heatmap_options': {'annot': True, 'cmap': 'coolwarm', 'center': 0, 'fmt': '.2f'},
+                'title': 'Correlation Matrix'
+            })
         
         # 3. Distribution plots for numerical columns
         numeric_cols = numeric_df.columns[:6]  # Limit to first 6 columns
         if len(numeric_cols) > 0:
-            fig, axes = plt.subplots(2, 3, figsize=(15, 10))
-            axes = axes.flatten()
-            
-            for idx, col in enumerate(numeric_cols):
-                if idx < len(axes):
-                    self.df[col].hist(bins=30, ax=axes[idx], edgecolor='black')
-                    axes[idx].set_title(f'Distribution of {col}')
-                    axes[idx].set_xlabel(col)
-                    axes[idx].set_ylabel('Frequency')
-            
-            # Hide unused subplots
-            for idx in range(len(numeric_cols), len(axes)):
-                axes[idx].set_visible(False)
-            
-            plt.tight_layout()
-            plt.savefig(f'{output_dir}/distributions.png', dpi=300)
-            plt.close()
+            charts.append({
+                'kind': 'hist_grid',
+                'output': f'{output_dir}/distributions.png',
+                'figsize': (15, 10),
+                'grid': (2, 3),
+                'columns': [(col, self.df[col].dropna().to_numpy()) for col in numeric_cols],
+                'bins': 30
+            })
+        
+        for chart in charts:
+            chart.update(style='whitegrid', title_style={}, savefig={'dpi': 300})
+        render_charts(charts)
         
         print(f"✓ Visualizations saved to {output_dir}/ directory")
     
-    def generate_html_report(self, output_file='reports/analysis_report.html'):
-        """Generate an HTML report with all analysis results"""
-        if self.df is None:
-            print("No data loaded. Please load data first.")
-            return
-        
-        # Ensure reports directory exists
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Excel Data Analysis Report</title>
-            <style>
-                body {{
-                    font-family: Arial, sans-serif;
-                    margin: 20px;
-                    background-color: #f5f5f5;
-                }}
-                .container {{
-                    max-width: 1200px;
-                    margin: 0 auto;
-                    background-color: white;
-                    padding: 30px;
-                    box-shadow: 0 0 10px rgba(0,0,0,0.1);
-                }}
-                h1 {{
-                    color: #2c3e50;
-                    border-bottom: 3px solid #3498db;
-                    padding-bottom: 10px;
-                }}
-                h2 {{
-                    color: #34495e;
-                    margin-top: 30px;
-                    border-left: 4px solid #3498db;
-                    padding-left: 10px;
-                }}
-                table {{
-                    border-collapse: collapse;
-                    width: 100%;
-                    margin: 20px 0;
-                }}
-                th, td {{
-                    border: 1px solid #ddd;
-                    padding: 12px;
-                    text-align: left;
-                }}
-                th {{
-                    background-color: #3498db;
-                    color: white;
-                }}
-                tr:nth-child(even) {{
-                    background-color: #f2f2f2;
-                }}
-                .metric {{
-                    background-color: #ecf0f1;
-                    padding: 15px;
-                    margin: 10px 0;
-                    border-radius: 5px;
-                }}
-                .metric-value {{
-                    font-size: 24px;
-                    font-weight: bold;
-                    color: #2980b9;
-                }}
-                img {{
-                    max-width: 100%;
-                    height: auto;
-                    margin: 20px 0;
-                    border: 1px solid #ddd;
-                    border-radius: 5px;
-                }}
-                .footer {{
-                    margin-top: 40px;
-                    text-align: center;
-                    color: #7f8c8d;
-                    font-size: 12px;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>📊 Excel Data Analysis Report</h1>
-                <p><strong>Generated on:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-                <p><strong>File:</strong> {self.file_path}</p>
-                
-                <h2>1. Dataset Overview</h2>
-                <div class="metric">
-                    <p>Total Rows: <span class="metric-value">{len(self.df)}</span></p>
-                    <p>Total Columns: <span class="metric-value">{len(self.df.columns)}</span></p>
-                    <p>Memory Usage: <span class="metric-value">{self.df.memory_usage(deep=True).sum() / 1024**2:.2f} MB</span></p>
-                </div>
-                
-                <h3>Column Information</h3>
-                <table>
-                    <tr>
-                        <th>Column Name</th>
-                        <th>Data Type</th>
-                        <th>Missing Values</th>
-                        <th>Missing %</th>
-                    </tr>
+    def generate_html_report(self, output_file='reports/analysis_report.html', sections=None):
         """
+        Generate an HTML report with all analysis results
         
-        # Add column information
-        for col in self.df.columns:
-            missing = self.df[col].isnull().sum()
-            missing_pct = (missing / len(self.df)) * 100
-            html_content += f"""
-                    <tr>
-                        <td>{col}</td>
-                        <td>{self.df[col].dtype}</td>
-                        <td>{missing}</td>
-                        <td>{missing_pct:.2f}%</td>
-                    </tr>
-            """
-        
-        html_content += """
-                </table>
-                
-                <h2>2. Statistical Summary</h2>
-        """
+        The report is streamed to the file one section at a time.
         
-        # Add numerical summary
-        numeric_df = self.df.select_dtypes(include=[np.number])
-        if len(numeric_df.columns) > 0:
-            html_content += "<h3>Numerical Columns</h3>"
-            html_content += numeric_df.describe().to_html()
-        
-        # Add categorical summary
-        categorical_df = self.df.select_dtypes(include=['object'])
-        if len(categorical_df.columns) > 0:
-            html_content += "<h3>Categorical Columns</h3><table><tr><th>Column</th><th>Unique Values</th><th>Most Frequent</th></tr>"
-            for col in categorical_df.columns:
-                unique = self.df[col].nunique()
-                top = self.df[col].mode()[0] if len(self.df[col].mode()) > 0 else "N/A"
-                html_content += f"<tr><td>{col}</td><td>{unique}</td><td>{top}</td></tr>"
-            html_content += "</table>"
-        
-        # Add data quality section
-        duplicates = len(self.df[self.df.duplicated()])
-        html_content += f"""
-                <h2>3. Data Quality</h2>
-                <div class="metric">
-                    <p>Duplicate Rows: <span class="metric-value">{duplicates}</span> ({(duplicates/len(self.df)*100):.2f}%)</p>
-                    <p>Total Missing Values: <span class="metric-value">{self.df.isnull().sum().sum()}</span></p>
-                </div>
+        Args:
+            output_file (str): Path of the HTML file
+            sections (list): Callables taking an HtmlReportWriter, written in
+                order (default: report_sections())
         """
+        if self._get_profile() is None or not self._check_loaded():
+            return
         
-        # Add visualizations if they exist
-        html_content += """
-                <h2>4. Visualizations</h2>
+        if sections is None:
+            sections = self.report_sections(os.path.dirname(output_file))
+        write_report(output_file, 'Excel Data Analysis Report', sections,
+                     heading='📊 Excel Data Analysis Report')
+        
+        print(f"✓ HTML report saved to {output_file}")
+        return output_file
+    
+    def report_sections(self, report_dir='reports'):
         """
+        Default sections of the HTML report
         
+        Args:
+            report_dir (str): Directory of the report, searched for chart images
+        
+        Returns:
+            list: Section callables for generate_html_report
+        """
+        return [
+            self._report_header,
+            self._report_overview,
+            self._report_statistics,
+            self._report_data_quality,
+            lambda writer: self._report_visualizations(writer, report_dir),
+            self._report_preview
+        ]
+    
+    def _report_header(self, writer):
+        writer.paragraph('Generated on', datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        writer.paragraph('File', self.file_path)
+    
+    def _report_overview(self, writer):
+        profile = self._get_profile()
+        basic_info = profile.basic_info()
+        missing_info = profile.missing_data()
+        
+        writer.section('Dataset Overview')
+        writer.metrics([
+            ('Total Rows', basic_info['total_rows'], None),
+            ('Total Columns', basic_info['total_columns'], None),
+            ('Memory Usage', f"{basic_info['memory_usage']:.2f} MB", None)
+        ])
+        
+        writer.subsection('Column Information')
+        writer.table(
+            ['Column Name', 'Data Type', 'Missing Values', 'Missing %'],
+            ((col, basic_info['data_types'][col], missing_info['missing_by_column'][col],
+              f"{missing_info['missing_percentage'][col]:.2f}%")
+             for col in basic_info['column_names'])
+        )
+    
+    def _report_statistics(self, writer):
+        profile = self._get_profile()
+        writer.section('Statistical Summary')
+        
+        numeric_describe = profile.describe_frame()
+        if len(numeric_describe.columns) > 0:
+            writer.subsection('Numerical Columns')
+            writer.frame(numeric_describe)
+        
+        categorical_summary = profile.categorical_summary()
+        if len(categorical_summary) > 0:
+            writer.subsection('Categorical Columns')
+            writer.table(
+                ['Column', 'Unique Values', 'Most Frequent'],
+                ((col, ('~' if col_summary['approximate'] else '') + str(col_summary['unique_values']),
+                  col_summary['top_value'] if col_summary['top_value'] is not None else "N/A")
+                 for col, col_summary in categorical_summary.items())
+            )
+    
+    def _report_data_quality(self, writer):
+        profile = self._get_profile()
+        duplicates = profile.duplicates()
+        metrics = [('Duplicate Rows', duplicates['total_duplicates'], f"({duplicates['duplicate_percentage']:.2f}%)")]
+        if all(col in profile.columns for col in DEFAULT_KEY_COLUMNS):
+            key_duplicates = self._detect_duplicates(DEFAULT_KEY_COLUMNS).summary()
+            metrics.append((f"Duplicate Leads ({', '.join(DEFAULT_KEY_COLUMNS)})", key_duplicates['total_duplicates'],
+                            f"({key_duplicates['duplicate_percentage']:.2f}%, "
+                            f"{key_duplicates['duplicate_clusters']} clusters)"))
+        metrics.append(('Total Missing Values', profile.missing_data()['total_missing'], None))
+        writer.section('Data Quality')
+        writer.metrics(metrics)
+    
+    def _report_visualizations(self, writer, report_dir):
+        writer.section('Visualizations')
         viz_files = ['correlation_heatmap.png', 'distributions.png', 'missing_data_heatmap.png']
         for viz_file in viz_files:
-            viz_path = f'reports/{viz_file}'
-            if os.path.exists(viz_path):
-                html_content += f'<img src="{viz_file}" alt="{viz_file}">'
-        
-        # Add data preview
-        html_content += f"""
-                <h2>5. Data Preview (First 10 Rows)</h2>
-                {self.df.head(10).to_html()}
-                
-                <div class="footer">
-                    <p>Report generated by Excel Analyzer Tool</p>
-                </div>
-            </div>
-        </body>
-        </html>
+            if os.path.exists(os.path.join(report_dir, viz_file)):
+                writer.image(viz_file)
+    
+    def _report_preview(self, writer):
+        writer.section('Data Preview (First 10 Rows)')
+        writer.frame(self.df.head(10))
+    
+    def export_to_excel(self, output_file='reports/analysis_summary.xlsx', raw_sidecar=None, engine=None):
         """
+        Export analysis results to Excel with multiple sheets
         
-        # Write to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        print(f"✓ HTML report saved to {output_file}")
-        return output_file
-    
-    def export_to_excel(self, output_file='reports/analysis_summary.xlsx'):
-        """Export analysis results to Excel with multiple sheets"""
-        if self.df is None:
-            print("No data loaded. Please load data first.")
+        Args:
+            output_file (str): Path of the .xlsx file
+            raw_sidecar (str): None to include the original data as a sheet, or
+                'parquet' / 'csv' to write it as a separate file instead
+            engine (str): 'xlsxwriter' or 'openpyxl' (default: xlsxwriter if installed)
+        """
+        profile = self._get_profile()
+        if profile is None or not self._check_loaded():
             return
         
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
-        
-        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+        with ExcelExport(output_file, engine=engine, raw_sidecar=raw_sidecar) as writer:
             # Original data
-            self.df.to_excel(writer, sheet_name='Original Data', index=False)
+            writer.write_records(self.df, 'Original Data')
             
             # Statistical summary
-            numeric_df = self.df.select_dtypes(include=[np.number])
-            if len(numeric_df.columns) > 0:
-                numeric_df.describe().to_excel(writer, sheet_name='Statistical Summary')
+            numeric_describe = profile.describe_frame()
+            if len(numeric_describe.columns) > 0:
+                writer.write(numeric_describe, 'Statistical Summary', index=True)
             
             # Missing data analysis
+            missing_info = profile.missing_data()
             missing_df = pd.DataFrame({
-                'Column': self.df.columns,
-                'Missing Count': self.df.isnull().sum().values,
-                'Missing %': (self.df.isnull().sum() / len(self.df) * 100).values
+                'Column': list(missing_info['missing_by_column'].keys()),
+                'Missing Count': list(missing_info['missing_by_column'].values()),
+                'Missing %': list(missing_info['missing_percentage'].values())
             })
-            missing_df.to_excel(writer, sheet_name='Missing Data', index=False)
+            writer.write(missing_df, 'Missing Data')
             
             # Correlation matrix
+            numeric_df = self.df.select_dtypes(include=[np.number])
             if len(numeric_df.columns) > 1:
-                numeric_df.corr().to_excel(writer, sheet_name='Correlation Matrix')
+                writer.write(numeric_df.corr(), 'Correlation Matrix', index=True)
         
         print(f"✓ Excel report saved to {output_file}")
         return output_file
@@ -0,0 +1,182 @@
+"""
+Excel Export
+Multi-sheet workbook writer that streams rows to disk. It uses xlsxwriter in
+constant-memory mode when installed and openpyxl's write-only mode
+otherwise, so large sheets are written row by row without building the
+whole workbook in memory. Raw-row sheets can be written as Parquet or CSV
+sidecar files instead, keeping only the summaries in the workbook.
+"""
+
+import os
+import re
+
+import pandas as pd
+
+# Rows converted to Python values at a time while streaming a sheet
+ROW_BATCH_SIZE = 10000
+
+# File formats supported for raw-row sidecars
+SIDECAR_FORMATS = ('parquet', 'csv')
+
+
+def default_engine():
+    """'xlsxwriter' if it is installed, otherwise 'openpyxl'"""
+    try:
+        import xlsxwriter  # noqa: F401
+        return 'xlsxwriter'
+    except ImportError:
+        return 'openpyxl'
+
+
+def _frame_rows(df, index):
+    """Yield the header and then every row of a frame as plain Python values"""
+    header = list(df.columns)
+    if index:
+        header = [df.index.name or ''] + header
+    yield [str(col) for col in header]
+
+    for start in range(0, len(df), ROW_BATCH_SIZE):
+        batch = df.iloc[start:start + ROW_BATCH_SIZE]
+        if index:
+            batch = batch.reset_index()
+        batch = batch.astype(object)
+        # Missing values become empty cells
+        batch = batch.where(batch.notna(), None)
+        yield from batch.itertuples(index=False, name=None)
+
+
+class _XlsxWriterBackend:
+    """Streams rows with xlsxwriter in constant_memory mode"""
+
+    def __init__(self, output_file):
+        import xlsxwriter
+        self.workbook = xlsxwriter.Workbook(output_file, {
+            'constant_memory': True,
+            'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+            'remove_timezone': True,
+            # Keep URL-like text as plain strings, as the openpyxl export did
+            'strings_to_urls': False
+        })
+        self.header_format = self.workbook.add_format({'bold': True, 'border': 1})
+
+    def write_sheet(self, sheet_name, rows):
+        worksheet = self.workbook.add_worksheet(sheet_name)
+        for row_idx, row in enumerate(rows):
+            worksheet.write_row(row_idx, 0, row, self.header_format if row_idx == 0 else None)
+
+    def close(self):
+        self.workbook.close()
+
+
+class _OpenpyxlBackend:
+    """Streams rows with an openpyxl write-only workbook"""
+
+    def __init__(self, output_file):
+        from openpyxl import Workbook
+        from openpyxl.styles import Font
+        self.output_file = output_file
+        self.workbook = Workbook(write_only=True)
+        self.header_font = Font(bold=True)
+
+    def write_sheet(self, sheet_name, rows):
+        from openpyxl.cell import WriteOnlyCell
+        worksheet = self.workbook.create_sheet(sheet_name)
+        rows = iter(rows)
+        header = []
+        for value in next(rows):
+            cell = WriteOnlyCell(worksheet, value=value)
+            cell.font = self.header_font
+            header.append(cell)
+        worksheet.append(header)
+        for row in rows:
+            worksheet.append(row)
+
+    def close(self):
+        self.workbook.save(self.output_file)
+
+
+# Workbook backends by engine name
+ENGINES = {
+    'xlsxwriter': _XlsxWriterBackend,
+    'openpyxl': _OpenpyxlBackend
+}
+
+
+class ExcelExport:
+    """Writes DataFrames to the sheets of one workbook"""
+
+    def __init__(self, output_file, engine=None, raw_sidecar=None):
+        """
+        Open the workbook for writing
+
+        Args:
+            output_file (str): Path of the .xlsx file
+            engine (str): 'xlsxwriter' or 'openpyxl' (default: default_engine())
+            raw_sidecar (str): None to keep raw-row sheets in the workbook, or
+                'parquet' / 'csv' to write them as separate files next to it
+        """
+        if raw_sidecar is not None and raw_sidecar not in SIDECAR_FORMATS:
+            raise ValueError(f"raw_sidecar must be one of {SIDECAR_FORMATS} or None, got {raw_sidecar!r}")
+
+        self.output_file = output_file
+        self.engine = engine or default_engine()
+        self.raw_sidecar = raw_sidecar
+        self.sidecars = []
+
+        output_dir = os.path.dirname(output_file)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        self._backend = ENGINES[self.engine](output_file)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def write(self, df, sheet_name, index=False):
+        """
+        Write a frame to a worksheet
+
+        Args:
+            df (pd.DataFrame): Data to write (a LeadSubset is written in
+                row batches without materializing it)
+            sheet_name (str): Worksheet name
+            index (bool): Write the index as the first column
+        """
+        self._backend.write_sheet(sheet_name, _frame_rows(df, index))
+
+    def write_records(self, df, sheet_name):
+        """
+        Write raw rows, either as a worksheet or as a sidecar file
+
+        Args:
+            df (pd.DataFrame): Rows to write, or a LeadSubset
+            sheet_name (str): Worksheet name, also used to name the sidecar
+
+        Returns:
+            str: Path of the sidecar file, or None if written to the workbook
+        """
+        if self.raw_sidecar is None:
+            self.write(df, sheet_name)
+            return None
+
+        base = os.path.splitext(self.output_file)[0]
+        slug = re.sub(r'[^0-9A-Za-z]+', '_', sheet_name).strip('_').lower()
+        path = f"{base}_{slug}.{self.raw_sidecar}"
+        if self.raw_sidecar == 'parquet':
+            df.to_parquet(path, index=False)
+        else:
+            df.to_csv(path, index=False, encoding='utf-8-sig')
+        self.sidecars.append((sheet_name, path, len(df)))
+        return path
+
+    def close(self):
+        """List any sidecar files in the workbook and save it"""
+        if self._backend is None:
+            return
+        if self.sidecars:
+            self.write(pd.DataFrame(self.sidecars, columns=['Sheet', 'File', 'Rows']), 'Raw Data Files')
+        self._backend.close()
+        self._backend = None
@@ -0,0 +1,235 @@
+"""
+HTML Report Writer
+Streams an HTML report to disk section by section. Tables are written row
+by row, so report size and build time grow linearly with the number of
+columns and no full document is ever held in memory.
+"""
+
+import html
+import os
+from string import Template
+
+# Stylesheet shared by all generated reports
+REPORT_STYLE = """
+        body {
+            font-family: Arial, sans-serif;
+            margin: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background-color: white;
+            padding: 30px;
+            box-shadow: 0 0 10px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #2c3e50;
+            border-bottom: 3px solid #3498db;
+            padding-bottom: 10px;
+        }
+        h2 {
+            color: #34495e;
+            margin-top: 30px;
+            border-left: 4px solid #3498db;
+            padding-left: 10px;
+        }
+        table {
+            border-collapse: collapse;
+            width: 100%;
+            margin: 20px 0;
+        }
+        th, td {
+            border: 1px solid #ddd;
+            padding: 12px;
+            text-align: left;
+        }
+        th {
+            background-color: #3498db;
+            color: white;
+        }
+        tr:nth-child(even) {
+            background-color: #f2f2f2;
+        }
+        .metric {
+            background-color: #ecf0f1;
+            padding: 15px;
+            margin: 10px 0;
+            border-radius: 5px;
+        }
+        .metric-value {
+            font-size: 24px;
+            font-weight: bold;
+            color: #2980b9;
+        }
+        img {
+            max-width: 100%;
+            height: auto;
+            margin: 20px 0;
+            border: 1px solid #ddd;
+            border-radius: 5px;
+        }
+        .footer {
+            margin-top: 40px;
+            text-align: center;
+            color: #7f8c8d;
+            font-size: 12px;
+        }
+"""
+
+# Document skeleton around the streamed sections
+PAGE_HEADER = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>$title</title>
+    <style>$style    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>$heading</h1>
+""")
+
+PAGE_FOOTER = Template("""
+        <div class="footer">
+            <p>$footer</p>
+        </div>
+    </div>
+</body>
+</html>
+""")
+
+
+def _cell(value):
+    """Escaped text of one table cell"""
+    return html.escape(str(value))
+
+
+class HtmlReportWriter:
+    """Writes the parts of an HTML report straight to the output file"""
+
+    def __init__(self, output_file, title, heading=None, footer='Report generated by Excel Analyzer Tool'):
+        """
+        Open the report for writing
+
+        The document is written to a temporary file and moved into place
+        on close(), so a failed run never leaves a truncated report.
+
+        Args:
+            output_file (str): Path of the HTML file
+            title (str): Page title
+            heading (str): Top-level heading (default: title)
+            footer (str): Footer text
+        """
+        self.output_file = output_file
+        self.footer = footer
+        self.section_count = 0
+
+        output_dir = os.path.dirname(output_file)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        self._tmp_path = output_file + '.tmp'
+        self._file = open(self._tmp_path, 'w', encoding='utf-8')
+        self._file.write(PAGE_HEADER.substitute(title=html.escape(title), style=REPORT_STYLE,
+                                                heading=html.escape(heading or title)))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+        return False
+
+    def write(self, markup):
+        """Write raw HTML"""
+        self._file.write(markup)
+
+    def paragraph(self, label, text):
+        """Write a '<strong>label:</strong> text' paragraph"""
+        self._file.write(f"        <p><strong>{_cell(label)}:</strong> {_cell(text)}</p>\n")
+
+    def section(self, title):
+        """Start a numbered section"""
+        self.section_count += 1
+        self._file.write(f"\n        <h2>{self.section_count}. {_cell(title)}</h2>\n")
+
+    def subsection(self, title):
+        """Write a sub-heading inside the current section"""
+        self._file.write(f"        <h3>{_cell(title)}</h3>\n")
+
+    def metrics(self, items):
+        """
+        Write a highlighted block of metrics
+
+        Args:
+            items (list): (label, value, note) tuples; note may be None
+        """
+        self._file.write('        <div class="metric">\n')
+        for label, value, note in items:
+            note = f" {_cell(note)}" if note else ''
+            self._file.write(f'            <p>{_cell(label)}: <span class="metric-value">{_cell(value)}</span>{note}</p>\n')
+        self._file.write('        </div>\n')
+
+    def table(self, headers, rows):
+        """
+        Write a table one row at a time
+
+        Args:
+            headers (list): Column headings
+            rows (iterable): Sequences of cell values; may be a generator
+        """
+        write = self._file.write
+        write("        <table>\n            <tr>")
+        write(''.join(f"<th>{_cell(h)}</th>" for h in headers))
+        write("</tr>\n")
+        for row in rows:
+            write("            <tr>")
+            write(''.join(f"<td>{_cell(value)}</td>" for value in row))
+            write("</tr>\n")
+        write("        </table>\n")
+
+    def frame(self, df, **to_html_options):
+        """Write a DataFrame as an HTML table directly into the report"""
+        df.to_html(buf=self._file, **to_html_options)
+        self._file.write('\n')
+
+    def image(self, src, alt=None):
+        """Embed an image by its path relative to the report"""
+        self._file.write(f'        <img src="{_cell(src)}" alt="{_cell(alt or src)}">\n')
+
+    def close(self):
+        """Write the footer and move the finished report into place"""
+        if self._file.closed:
+            return
+        self._file.write(PAGE_FOOTER.substitute(footer=_cell(self.footer)))
+        self._file.close()
+        os.replace(self._tmp_path, self.output_file)
+
+    def abort(self):
+        """Discard a partially written report"""
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+def write_report(output_file, title, sections, **writer_options):
+    """
+    Build a report from pluggable section callables
+
+    Args:
+        output_file (str): Path of the HTML file
+        title (str): Page title
+        sections (list): Callables taking the HtmlReportWriter, called in order
+        **writer_options: Extra HtmlReportWriter arguments
+
+    Returns:
+        str: Path of the written report
+    """
+    with HtmlReportWriter(output_file, title, **writer_options) as writer:
+        for section in sections:
+            section(writer)
+    return output_file
@@ -0,0 +1,245 @@
+"""
+Incremental Lead Ingestion
+Keeps a local store of the leads seen in earlier exports and, for a new
+export, classifies only the inserted and updated rows. The active-lead,
+bounced, region and role aggregates are maintained by subtracting the old
+contribution of changed or deleted rows and adding the new one, instead of
+rescanning the whole export.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+
+import pandas as pd
+
+from data_profiler import number_text, row_hashes
+from lead_data_loader import DEFAULT_CACHE_DIR
+from lead_metrics import BOUNCE_PATTERN, INACTIVE_STAGES, active_mask, bounced_mask
+from region_mapping import COUNTRY_ALIASES, REGION_RULES, assign_regions, build_region_table
+from role_classifier import ROLE_CATEGORIES, RoleClassifier
+
+# Location of the lead store
+DEFAULT_STORE_DIR = os.path.join(DEFAULT_CACHE_DIR, 'lead_store')
+
+# Stable identifier of a lead in the CRM export
+DEFAULT_KEY_COLUMN = 'Lead Number'
+
+# Label used for missing countries and regions in the aggregates
+MISSING_LABEL = 'Missing/Unknown'
+
+
+def _rules_signature(key_column):
+    """Digest of every rule the stored classifications depend on"""
+    # 'row_hashes' names the row hash the stored rows were compared with
+    rules = [key_column, 'row_hashes', INACTIVE_STAGES, BOUNCE_PATTERN, REGION_RULES, COUNTRY_ALIASES,
+             ROLE_CATEGORIES]
+    return hashlib.sha1(json.dumps(rules, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def row_keys(df, key_column=DEFAULT_KEY_COLUMN):
+    """
+    Stable key of every row
+
+    Uses key_column when it is present, complete and unique. Otherwise the
+    key is the row hash plus its occurrence number, so an edited row shows
+    up as a deletion plus an insertion. Keys and hashes do not depend on
+    the dtypes a load inferred (e.g. a column that is int64 in one export
+    and float64 in the next), so only edited rows count as updated.
+
+    Args:
+        df (pd.DataFrame): Lead export
+        key_column (str): Lead identifier column
+
+    Returns:
+        tuple: (pd.Index of keys, pd.Series of row hashes)
+    """
+    hashes = pd.Series(row_hashes(df), index=df.index)
+    if key_column in df.columns:
+        keys = df[key_column]
+        if keys.notna().all() and keys.is_unique:
+            if pd.api.types.is_numeric_dtype(keys) and not pd.api.types.is_bool_dtype(keys):
+                keys = number_text(keys)
+            return pd.Index(keys.astype(str), name='key'), hashes
+    occurrence = hashes.groupby(hashes).cumcount()
+    keys = hashes.astype(str) + '-' + occurrence.astype(str)
+    return pd.Index(keys, name='key'), hashes
+
+
+def classify_rows(df, classifier=None):
+    """
+    Derive the attributes the aggregates are built from
+
+    Args:
+        df (pd.DataFrame): Lead rows (not modified)
+        classifier (RoleClassifier): Role matcher (default: ROLE_CATEGORIES)
+
+    Returns:
+        pd.DataFrame: Country, Region, active, bounced and one flag per role
+            category, aligned with df.index
+    """
+    classifier = classifier or RoleClassifier(ROLE_CATEGORIES)
+    regions = df[['Country', 'Region Specific']].copy()
+    assign_regions(regions, build_region_table())
+
+    derived = pd.DataFrame({
+        'Country': df['Country'].astype(object).fillna(MISSING_LABEL),
+        'Region': regions['Region Specific'].astype(object).fillna(MISSING_LABEL),
+        'active': active_mask(df).to_numpy(),
+        'bounced': bounced_mask(df).to_numpy()
+    }, index=df.index)
+    role_flags = classifier.classify(df['Role'])
+    return pd.concat([derived, role_flags], axis=1)
+
+
+def contributions(derived):
+    """
+    Aggregate counts contributed by a set of classified rows
+
+    Args:
+        derived (pd.DataFrame): Output of classify_rows
+
+    Returns:
+        dict: 'active_by_country', 'bounced_by_country' and
+            'region_distribution' Series plus a 'roles_by_country' frame
+    """
+    role_columns = [col for col in derived.columns
+                    if col not in ('Country', 'Region', 'active', 'bounced', '_row_hash')]
+    return {
+        'total_leads': len(derived),
+        'active_by_country': derived.loc[derived['active'], 'Country'].value_counts(),
+        'bounced_by_country': derived.loc[derived['bounced'], 'Country'].value_counts(),
+        'region_distribution': derived['Region'].value_counts(),
+        'roles_by_country': derived[role_columns].groupby(derived['Country']).sum()
+    }
+
+
+def _combine(current, delta, sign):
+    """Add (sign=1) or subtract (sign=-1) one aggregate from another"""
+    if not isinstance(current, (pd.Series, pd.DataFrame)):
+        return current + sign * delta
+    combined = current.add(sign * delta, fill_value=0).astype('int64')
+    if isinstance(combined, pd.DataFrame):
+        totals = combined.sum(axis=1)
+        return combined.loc[totals[totals != 0].sort_values(ascending=False).index]
+    return combined[combined != 0].sort_values(ascending=False)
+
+
+class LeadStore:
+    """Previously seen leads with their classifications and running aggregates"""
+
+    def __init__(self, store_dir=DEFAULT_STORE_DIR, key_column=DEFAULT_KEY_COLUMN):
+        """
+        Open (or start) a lead store
+
+        Args:
+            store_dir (str): Directory holding the store
+            key_column (str): Lead identifier column
+        """
+        self.store_dir = store_dir
+        self.key_column = key_column
+        self.signature = _rules_signature(key_column)
+        self.rows = None
+        self.aggregates = None
+        self._load()
+
+    @property
+    def _rows_path(self):
+        return os.path.join(self.store_dir, 'leads.parquet')
+
+    @property
+    def _state_path(self):
+        return os.path.join(self.store_dir, 'state.pkl')
+
+    def _load(self):
+        """Read the stored state, discarding it if the rules have changed"""
+        if not (os.path.exists(self._rows_path) and os.path.exists(self._state_path)):
+            return
+        try:
+            with open(self._state_path, 'rb') as f:
+                state = pickle.load(f)
+            if state['signature'] != self.signature:
+                print("⚠ Lead rules changed since the last run, rebuilding the lead store")
+                return
+            self.rows = pd.read_parquet(self._rows_path)
+            self.aggregates = state['aggregates']
+        except Exception as e:
+            print(f"⚠ Ignoring unreadable lead store: {e}")
+            self.rows = None
+            self.aggregates = None
+
+    def _save(self):
+        """Write the rows and aggregates atomically"""
+        os.makedirs(self.store_dir, exist_ok=True)
+        tmp_rows = self._rows_path + '.tmp'
+        tmp_state = self._state_path + '.tmp'
+        self.rows.to_parquet(tmp_rows)
+        with open(tmp_state, 'wb') as f:
+            pickle.dump({'signature': self.signature, 'aggregates': self.aggregates}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_rows, self._rows_path)
+        os.replace(tmp_state, self._state_path)
+
+    def ingest(self, df):
+        """
+        Bring the store up to date with a new export
+
+        Args:
+            df (pd.DataFrame): Full lead export
+
+        Returns:
+            dict: Row counts 'inserted', 'updated', 'deleted' and 'unchanged'
+        """
+        keys, hashes = row_keys(df, self.key_column)
+        hashes = pd.Series(hashes.to_numpy(), index=keys)
+
+        if self.rows is None:
+            previous = pd.Series(dtype='uint64', index=pd.Index([], dtype=object, name='key'))
+        else:
+            previous = self.rows['_row_hash']
+
+        is_known = keys.isin(previous.index)
+        inserted = keys[~is_known]
+        known = keys[is_known]
+        updated = known[hashes[known].to_numpy() != previous[known].to_numpy()]
+        deleted = previous.index[~previous.index.isin(keys)]
+
+        # Only new and changed rows are classified
+        changed = ~is_known | keys.isin(updated)
+        derived = classify_rows(df[changed])
+        derived.index = keys[changed]
+        derived['_row_hash'] = hashes[derived.index].to_numpy()
+
+        if self.rows is None:
+            self.rows = derived.iloc[:0]
+            self.aggregates = {name: 0 if isinstance(value, int) else value
+                               for name, value in contributions(self.rows).items()}
+
+        removed = self.rows.loc[deleted.append(updated)]
+        for name, delta in contributions(removed).items():
+            self.aggregates[name] = _combine(self.aggregates[name], delta, -1)
+        for name, delta in contributions(derived).items():
+            self.aggregates[name] = _combine(self.aggregates[name], delta, 1)
+        self.rows = pd.concat([self.rows.drop(index=removed.index), derived])
+
+        self._save()
+        return {
+            'inserted': len(inserted),
+            'updated': len(updated),
+            'deleted': len(deleted),
+            'unchanged': len(known) - len(updated)
+        }
+
+    def summary(self):
+        """
+        Current aggregates
+
+        Returns:
+            dict: total_leads, active_leads and bounced_leads counts plus the
+                aggregate Series/frames from contributions()
+        """
+        aggregates = dict(self.aggregates)
+        aggregates['active_leads'] = int(aggregates['active_by_country'].sum())
+        aggregates['bounced_leads'] = int(aggregates['bounced_by_country'].sum())
+        return aggregates
@@ -0,0 +1,71 @@
+"""
+Incremental Lead Ingestion
+Updates the lead store from the latest CRM export and prints the active,
+bounced, region and role figures without reprocessing unchanged leads
+"""
+
+from incremental_ingest import LeadStore
+from lead_data_loader import load_lead_data
+
+# Load the Excel file
+file_path = r"C:\Users\karul\Downloads\Raw File-LS-Full Data.xlsx"
+
+
+def main():
+    """Ingest the latest export and print the running aggregates"""
+    print("=" * 70)
+    print("Incremental Lead Ingestion")
+    print("=" * 70)
+
+    # Load data
+    print("\nLoading data...")
+    df = load_lead_data(file_path)
+    print(f"✓ Loaded {len(df):,} rows and {len(df.columns)} columns")
+
+    store = LeadStore()
+    changes = store.ingest(df)
+
+    print("\n" + "=" * 70)
+    print("Changes Since Last Run")
+    print("=" * 70)
+    for label in ['inserted', 'updated', 'deleted', 'unchanged']:
+        print(f"  {label.capitalize():<12}: {changes[label]:>10,}")
+
+    summary = store.summary()
+    total = summary['total_leads']
+
+    print("\n" + "=" * 70)
+    print("Lead Totals")
+    print("=" * 70)
+    print(f"  Total Leads   : {total:>10,}")
+    if total:
+        print(f"  Active Leads  : {summary['active_leads']:>10,} ({summary['active_leads'] / total * 100:.2f}%)")
+        print(f"  Bounced Leads : {summary['bounced_leads']:>10,} ({summary['bounced_leads'] / total * 100:.2f}%)")
+
+    print("\n📍 Region Distribution:")
+    print("-" * 70)
+    for region, count in summary['region_distribution'].items():
+        print(f"  {str(region):<30} {count:>10,}")
+
+    print("\n🌍 Top 10 Countries - Active Leads:")
+    print("-" * 70)
+    for country, count in summary['active_by_country'].head(10).items():
+        print(f"  {str(country):<30} {count:>10,}")
+
+    print("\n🌍 Top 10 Countries - Bounced Emails:")
+    print("-" * 70)
+    for country, count in summary['bounced_by_country'].head(10).items():
+        print(f"  {str(country):<30} {count:>10,}")
+
+    print("\n👥 Role Categories:")
+    print("-" * 70)
+    for category, count in summary['roles_by_country'].sum().items():
+        print(f"  {category:<30} {count:>10,}")
+
+    print("\n" + "=" * 70)
+    print("✓ Lead store updated!")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
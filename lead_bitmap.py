@@ -0,0 +1,214 @@
+"""
+Lead Bitmap Index
+Packed bitmaps (one bit per lead) for the lead flags and for every value of
+the low-cardinality lead columns. Named masks such as 'active', 'bounced'
+or 'Region Specific==EU' are computed once per dataset and combined with
+&, | and ~ on the packed bits, so compound filters never touch or copy the
+DataFrame; only the final selection gathers the matching rows.
+"""
+
+import numpy as np
+import pandas as pd
+
+from lead_data_loader import remove_unused_categories
+from lead_metrics import active_mask, bounced_mask
+from lead_subset import LeadSubset
+from string_predicates import distinct_codes
+
+# Flags available by name, each defined once in lead_metrics
+NAMED_MASKS = {
+    'active': active_mask,
+    'bounced': bounced_mask
+}
+
+# Number of set bits of every byte value
+_POPCOUNT = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+
+class Bitmap:
+    """Set of row positions stored as packed bits"""
+
+    def __init__(self, bits, length):
+        """
+        Wrap packed bits; use Bitmap.from_mask to create a bitmap
+
+        Args:
+            bits (np.ndarray): uint8 array from np.packbits
+            length (int): Number of rows the bitmap covers
+        """
+        self.bits = bits
+        self.length = length
+
+    @classmethod
+    def from_mask(cls, mask):
+        """Pack a boolean mask (array or Series, missing counted as False)"""
+        if isinstance(mask, pd.Series):
+            mask = mask.fillna(False).to_numpy(dtype=bool)
+        mask = np.asarray(mask, dtype=bool)
+        return cls(np.packbits(mask), len(mask))
+
+    def _check(self, other):
+        if self.length != other.length:
+            raise ValueError(f"Bitmaps cover different row counts ({self.length:,} vs {other.length:,})")
+
+    def __and__(self, other):
+        self._check(other)
+        return Bitmap(self.bits & other.bits, self.length)
+
+    def __or__(self, other):
+        self._check(other)
+        return Bitmap(self.bits | other.bits, self.length)
+
+    def __sub__(self, other):
+        self._check(other)
+        return Bitmap(self.bits & ~other.bits, self.length)
+
+    def __invert__(self):
+        bits = ~self.bits
+        # Clear the padding bits after the last row
+        tail = self.length % 8
+        if tail:
+            bits[-1] &= np.uint8((0xFF << (8 - tail)) & 0xFF)
+        return Bitmap(bits, self.length)
+
+    def count(self):
+        """Number of rows in the set"""
+        return int(_POPCOUNT[self.bits].sum(dtype=np.int64))
+
+    def to_mask(self):
+        """Boolean array with one entry per row"""
+        return np.unpackbits(self.bits, count=self.length).astype(bool)
+
+    def positions(self):
+        """Row positions in the set, in ascending order"""
+        return np.flatnonzero(np.unpackbits(self.bits, count=self.length))
+
+
+class LeadBitmaps:
+    """Lazily built bitmap index of one lead dataset"""
+
+    def __init__(self, df, named_masks=NAMED_MASKS):
+        """
+        Index a dataset; bitmaps are built on first use and then reused
+
+        Args:
+            df (pd.DataFrame): Lead data
+            named_masks (dict): Mask name -> function returning a boolean mask of df
+        """
+        self.df = df
+        self.named_masks = named_masks
+        self._named = {}
+        self._values = {}
+
+    def _value_bitmaps(self, column):
+        """
+        Bitmap of every value of a column, built in one pass over its codes
+
+        The row positions are sorted by code once; each value then sets the
+        bits of its own run of positions, so the work grows with the rows
+        rather than with rows times distinct values.
+        """
+        if column not in self._values:
+            codes, uniques = distinct_codes(self.df[column])
+            order = np.argsort(codes, kind='stable')
+            bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+            self._values[column] = {
+                value: self._positions_bitmap(order[bounds[code]:bounds[code + 1]])
+                for code, value in enumerate(uniques)
+            }
+        return self._values[column]
+
+    def _positions_bitmap(self, positions):
+        """Bitmap with the bits of ascending row positions set"""
+        bits = np.zeros((len(self.df) + 7) // 8, dtype=np.uint8)
+        if len(positions):
+            byte_index = positions >> 3
+            # Bits of one byte are distinct, so summing them sets them all
+            starts = np.flatnonzero(np.r_[True, byte_index[1:] != byte_index[:-1]])
+            masks = (128 >> (positions & 7)).astype(np.uint8)
+            bits[byte_index[starts]] = np.add.reduceat(masks, starts)
+        return Bitmap(bits, len(self.df))
+
+    def equals(self, column, value):
+        """
+        Rows where a column has a given value
+
+        Args:
+            column (str): Column of the dataset
+            value: Value to match; None for missing values
+
+        Returns:
+            Bitmap: Matching rows
+        """
+        if value is None:
+            return self.isna(column)
+        bitmaps = self._value_bitmaps(column)
+        if value in bitmaps:
+            return bitmaps[value]
+        return Bitmap(np.zeros((len(self.df) + 7) // 8, dtype=np.uint8), len(self.df))
+
+    def isin(self, column, values):
+        """Rows where a column has any of the given values"""
+        result = Bitmap(np.zeros((len(self.df) + 7) // 8, dtype=np.uint8), len(self.df))
+        for value in values:
+            result = result | self.equals(column, value)
+        return result
+
+    def isna(self, column):
+        """Rows where a column is missing"""
+        key = f"{column} is missing"
+        if key not in self._named:
+            self._named[key] = Bitmap.from_mask(self.df[column].isna())
+        return self._named[key]
+
+    def __getitem__(self, name):
+        """
+        Bitmap of a named mask ('active') or a value test ('Region Specific==EU')
+
+        Args:
+            name (str): Key of named_masks, or '<column>==<value>'
+
+        Returns:
+            Bitmap: Matching rows
+        """
+        if name in self.named_masks:
+            if name not in self._named:
+                self._named[name] = Bitmap.from_mask(self.named_masks[name](self.df))
+            return self._named[name]
+        if '==' in name:
+            column, value = (part.strip() for part in name.split('==', 1))
+            return self.equals(column, value)
+        raise KeyError(f"Unknown mask '{name}'")
+
+    def select(self, bitmap, columns=None):
+        """
+        Gather the rows of a bitmap into a new frame
+
+        Rows are taken by position in one step, so no intermediate copy is
+        made, and unused categories are dropped from the result.
+
+        Args:
+            bitmap (Bitmap or str): Rows to select, or a mask name
+            columns (list): Columns to keep (default: all)
+
+        Returns:
+            pd.DataFrame: The selected rows
+        """
+        if isinstance(bitmap, str):
+            bitmap = self[bitmap]
+        source = self.df if columns is None else self.df[columns]
+        return remove_unused_categories(source.take(bitmap.positions()))
+
+    def view(self, bitmap):
+        """
+        Lazy subset of the rows of a bitmap, see LeadSubset
+
+        Args:
+            bitmap (Bitmap or str): Rows to select, or a mask name
+
+        Returns:
+            LeadSubset: View of the rows that gathers columns on demand
+        """
+        if isinstance(bitmap, str):
+            bitmap = self[bitmap]
+        return LeadSubset(self.df, bitmap.positions())
@@ -0,0 +1,147 @@
+"""
+Lead Cube
+Pre-aggregated lead counts over the lead dimensions (Country, Lead Stage,
+Region Specific, ...) and the lead flags (active, bounced, role categories).
+The cube is built with one groupby per dataset version; breakdowns,
+filtered breakdowns and top-N lists are then answered from its cells
+without touching the raw rows.
+"""
+
+import pandas as pd
+
+from role_classifier import ROLE_CATEGORIES, RoleClassifier
+
+# Columns the cube counts over
+CUBE_DIMENSIONS = [
+    'Country',
+    'Lead Stage',
+    'Region Specific',
+    'Industry Vertical',
+    'Lead Source',
+    'Company size',
+    'Last Activity'
+]
+
+
+class LeadCube:
+    """Counts of leads per combination of dimension values and flags"""
+
+    def __init__(self, cells):
+        """
+        Wrap precomputed cells; use LeadCube.build to create a cube
+
+        Args:
+            cells (pd.DataFrame): One row per observed combination of the
+                dimension and flag columns, with its row count in 'count'
+        """
+        self.cells = cells
+
+    @classmethod
+    def build(cls, df, dimensions=CUBE_DIMENSIONS, flags=None, role_categories=ROLE_CATEGORIES):
+        """
+        Aggregate a lead dataset into a cube
+
+        Args:
+            df (pd.DataFrame): Lead data
+            dimensions (list): Columns to count over; missing ones are skipped
+            flags (dict): Flag name -> function returning a boolean mask of df,
+                e.g. {'active': active_mask}
+            role_categories (dict): Role categories added as flags (None for none)
+
+        Returns:
+            LeadCube: The aggregated cube
+        """
+        keys = {col: df[col] for col in dimensions if col in df.columns}
+        for name, mask in (flags or {}).items():
+            keys[name] = pd.Series(mask(df), index=df.index)
+        if role_categories and 'Role' in df.columns:
+            role_flags = RoleClassifier(role_categories).classify(df['Role'])
+            for category in role_flags.columns:
+                keys[category] = role_flags[category]
+
+        key_frame = pd.DataFrame(keys, index=df.index)
+        if len(key_frame.columns) == 0:
+            return cls(pd.DataFrame({'count': [len(df)]}))
+        cells = key_frame.groupby(list(key_frame.columns), observed=True, dropna=False).size()
+        return cls(cells.rename('count').reset_index())
+
+    @property
+    def dimensions(self):
+        """Dimension and flag columns of the cube"""
+        return [col for col in self.cells.columns if col != 'count']
+
+    def _select(self, where):
+        """Cells matching a filter of the form {column: value or list of values}"""
+        if not where:
+            return self.cells
+        mask = pd.Series(True, index=self.cells.index)
+        for col, value in where.items():
+            if col not in self.cells.columns:
+                raise ValueError(f"'{col}' is not a dimension of the lead cube")
+            if isinstance(value, (list, tuple, set)):
+                mask &= self.cells[col].isin(list(value))
+            else:
+                mask &= self.cells[col] == value
+        return self.cells[mask]
+
+    def total(self, where=None):
+        """
+        Number of leads matching a filter
+
+        Args:
+            where (dict): Column -> required value (or list of values),
+                e.g. {'active': True, 'Region Specific': 'EU'}
+
+        Returns:
+            int: Lead count
+        """
+        return int(self._select(where)['count'].sum())
+
+    def breakdown(self, columns, where=None, dropna=False):
+        """
+        Lead counts per combination of one or more columns
+
+        Args:
+            columns (list): Columns to group by
+            where (dict): Filter, see total()
+            dropna (bool): Exclude missing values (default: False)
+
+        Returns:
+            pd.Series: Counts sorted in descending order, like value_counts;
+                equal counts are ordered by value (missing values last), not
+                by first appearance in the rows, so top-N lists can differ
+                from value_counts on the raw rows at ties
+        """
+        cells = self._select(where)
+        # groupby sorts by the key values; the stable sort keeps that order for ties
+        counts = cells.groupby(list(columns), observed=True, dropna=dropna)['count'].sum()
+        return counts[counts > 0].sort_values(ascending=False, kind='stable')
+
+    def counts(self, column, where=None, dropna=False):
+        """
+        value_counts of one column, optionally restricted by a filter
+
+        Args:
+            column (str): Column to count
+            where (dict): Filter, see total()
+            dropna (bool): Exclude missing values (default: False)
+
+        Returns:
+            pd.Series: Counts sorted in descending order
+        """
+        return self.breakdown([column], where, dropna)
+
+    def top(self, column, n=10, where=None):
+        """
+        The n most frequent values of a column
+
+        Args:
+            column (str): Column to rank
+            n (int): Number of values
+            where (dict): Filter, see total()
+
+        Returns:
+            pd.Series: Counts of the top values, missing values excluded;
+                values tied at the cutoff are taken in value order
+        """
+        return self.counts(column, where, dropna=True).head(n)
@@ -0,0 +1,392 @@
+"""
+Lead Data Loader
+Shared loader for the lead workbooks. Converts an Excel sheet once into a
+columnar Parquet cache and reuses that cache on later runs.
+"""
+
+import hashlib
+import json
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
+from openpyxl import load_workbook
+from pandas.io.parsers import TextParser
+
+from result_cache import tag_fingerprint
+
+# Default location of the columnar cache
+DEFAULT_CACHE_DIR = os.path.join('reports', '.cache')
+
+# Rows per chunk when streaming a workbook
+DEFAULT_CHUNK_SIZE = 50000
+
+# Text columns with at most this share of distinct values are stored as category
+DEFAULT_CATEGORY_THRESHOLD = 0.05
+
+
+def _path_digest(file_path, sheet_name):
+    """Digest identifying a workbook sheet independent of its contents"""
+    raw = f"{os.path.abspath(file_path)}|{sheet_name}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+
+def cache_key(file_path, sheet_name=0):
+    """
+    Build the cache key for a workbook sheet
+
+    The key combines the absolute path and sheet with the file size and
+    modification time, so any change to the workbook produces a new key.
+
+    Args:
+        file_path (str): Path to the Excel file
+        sheet_name: Sheet name or index (default: 0)
+
+    Returns:
+        str: Cache key of the form '<path digest>-<stat digest>'
+    """
+    stat = os.stat(file_path)
+    stat_raw = f"{stat.st_size}|{stat.st_mtime_ns}"
+    stat_digest = hashlib.sha1(stat_raw.encode('utf-8')).hexdigest()[:16]
+    return f"{_path_digest(file_path, sheet_name)}-{stat_digest}"
+
+
+def cache_path(file_path, sheet_name=0, cache_dir=DEFAULT_CACHE_DIR):
+    """Return the Parquet cache file used for a workbook sheet"""
+    return os.path.join(cache_dir, f"{cache_key(file_path, sheet_name)}.parquet")
+
+
+def _normalize_mixed_columns(df):
+    """
+    Convert object columns holding mixed Python types to strings
+
+    Excel exports often mix numbers and text in one column (e.g. phone
+    numbers). Parquet needs one type per column, and normalizing on every
+    load keeps cold and warm loads identical. The numbers of such a column
+    therefore stay text downstream: workbooks exported from the loaded
+    data write them as text cells, not numbers.
+    """
+    for col in df.select_dtypes(include=['object']).columns:
+        inferred = pd.api.types.infer_dtype(df[col], skipna=True)
+        if inferred in ('mixed', 'mixed-integer'):
+            df[col] = df[col].map(lambda value: value if pd.isna(value) else str(value))
+    return df
+
+
+def categorize_columns(df, threshold=DEFAULT_CATEGORY_THRESHOLD):
+    """
+    Store low-cardinality text columns as pandas category
+
+    Columns such as Country, Lead Stage or Region Specific hold a handful of
+    distinct values repeated over every row. As categories they take a
+    fraction of the memory, and value_counts, isin and == comparisons run
+    on integer codes instead of Python strings.
+
+    Args:
+        df (pd.DataFrame): Frame to convert in place
+        threshold (float): Maximum ratio of distinct values to rows for a
+            column to be converted. None disables the conversion.
+
+    Returns:
+        pd.DataFrame: The same frame, for chaining
+    """
+    if threshold is None or len(df) == 0:
+        return df
+    max_unique = threshold * len(df)
+    for col in df.columns:
+        series = df[col]
+        if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+            continue
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            continue
+        if series.nunique() <= max_unique:
+            df[col] = series.astype('category')
+    return df
+
+
+def remove_unused_categories(df):
+    """
+    Drop categories that no longer occur after filtering a frame
+
+    A filtered subset keeps every category of its parent, so value_counts
+    would otherwise list the filtered-out values with a count of zero.
+
+    Args:
+        df (pd.DataFrame): Filtered frame to clean in place
+
+    Returns:
+        pd.DataFrame: The same frame, for chaining
+    """
+    for col in df.select_dtypes(include=['category']).columns:
+        df[col] = df[col].cat.remove_unused_categories()
+    return df
+
+
+def _remove_stale_entries(file_path, sheet_name, cache_dir, keep):
+    """Delete cache files left behind by older versions of the same workbook"""
+    prefix = _path_digest(file_path, sheet_name) + '-'
+    for name in os.listdir(cache_dir):
+        if name.startswith(prefix) and name != keep:
+            try:
+                os.remove(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+
+
+def _write_cache(df, path, file_path, sheet_name, cache_dir):
+    """Write the cache atomically so an interrupted run never leaves a partial file"""
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = path + '.tmp'
+    try:
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        _remove_stale_entries(file_path, sheet_name, cache_dir, os.path.basename(path))
+    except Exception as e:
+        print(f"⚠ Could not write columnar cache: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _tag(df, file_path, sheet_name, **options):
+    """Tag a loaded frame with the identity of its file and the load options, see tag_fingerprint"""
+    raw = json.dumps([cache_key(file_path, sheet_name), options], sort_keys=True, default=str)
+    return tag_fingerprint(df, hashlib.sha1(raw.encode('utf-8')).hexdigest())
+
+
+def _project(df, columns, category_threshold, dtype):
+    """Keep the requested columns in the requested order, then set the column types"""
+    if columns is not None:
+        missing = [col for col in columns if col not in df.columns]
+        if missing:
+            raise ValueError(f"Columns not found in the lead data: {', '.join(missing)}")
+        df = df[columns]
+    df = categorize_columns(df, category_threshold)
+    if dtype:
+        df = df.astype(dtype)
+    return df
+
+
+def load_lead_data(file_path, sheet_name=0, use_cache=True, cache_dir=DEFAULT_CACHE_DIR,
+                   category_threshold=DEFAULT_CATEGORY_THRESHOLD, columns=None, dtype=None):
+    """
+    Load a lead workbook, using the columnar cache when it is up to date
+
+    The first load parses the workbook with openpyxl and stores the result
+    as Parquet. Later loads of the same unchanged file read the Parquet
+    cache instead, and only the requested columns are read from it.
+
+    Args:
+        file_path (str): Path to the Excel file
+        sheet_name: Sheet name or index to load (default: 0)
+        use_cache (bool): Read and write the columnar cache (default: True)
+        cache_dir (str): Directory holding the cache files
+        category_threshold (float): Distinct-value ratio below which text
+            columns become category (see categorize_columns). None keeps
+            every text column as object.
+        columns (list): Columns to load, in this order (default: all). The
+            cache is always written with every column, so other scripts can
+            project different columns from it; without the cache only these
+            columns are parsed from the workbook.
+        dtype (dict): Column -> dtype, applied after category inference
+
+    Returns:
+        pd.DataFrame: The loaded sheet, tagged with the identity of the file
+            (see tag_fingerprint)
+    """
+    options = {'columns': columns, 'dtype': dtype, 'category_threshold': category_threshold}
+    if not use_cache:
+        df = pd.read_excel(file_path, sheet_name=sheet_name, usecols=columns, dtype=dtype)
+        df = _project(_normalize_mixed_columns(df), columns, category_threshold, dtype)
+        return _tag(df, file_path, sheet_name, **options)
+
+    path = cache_path(file_path, sheet_name, cache_dir)
+    if os.path.exists(path):
+        try:
+            if columns is not None:
+                available = pq.read_schema(path).names
+                df = pd.read_parquet(path, columns=[col for col in columns if col in available])
+            else:
+                df = pd.read_parquet(path)
+        except Exception as e:
+            print(f"⚠ Ignoring unreadable cache {path}: {e}")
+        else:
+            return _tag(_project(df, columns, category_threshold, dtype), file_path, sheet_name, **options)
+
+    df = _normalize_mixed_columns(pd.read_excel(file_path, sheet_name=sheet_name))
+    _write_cache(df, path, file_path, sheet_name, cache_dir)
+    return _tag(_project(df, columns, category_threshold, dtype), file_path, sheet_name, **options)
+
+
+def write_snapshot(df, path):
+    """
+    Write a DataFrame as an uncompressed Arrow IPC (Feather v2) file
+
+    Unlike the compressed Parquet cache, an uncompressed IPC file can be
+    memory-mapped: processes opening it with open_snapshot share the pages
+    of the file through the OS instead of each receiving a pickled copy.
+    The file is written atomically.
+
+    Args:
+        df (pd.DataFrame): Frame to write
+        path (str): Destination file
+
+    Returns:
+        str: The path of the snapshot
+    """
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    try:
+        feather.write_feather(df, tmp_path, compression='uncompressed')
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return path
+
+
+# Arrow text types kept Arrow-backed when a snapshot is opened
+_ARROW_STRINGS = {
+    pa.string(): pd.StringDtype('pyarrow'),
+    pa.large_string(): pd.StringDtype('pyarrow')
+}
+
+
+def open_snapshot(path, columns=None):
+    """
+    Open a snapshot written by write_snapshot through a memory map
+
+    Only the requested columns are touched. What stays in the shared pages
+    of the file and what is copied into each process:
+
+    - text columns stay Arrow-backed (pandas 'string[pyarrow]' dtype), so
+      their characters are read from the map instead of being turned into
+      Python objects per process;
+    - numeric columns without missing values are exposed without copying;
+    - category columns get their own (small) integer code array and
+      categories, and numeric columns with missing values are copied to
+      fill in NaN.
+
+    Args:
+        path (str): Snapshot file
+        columns (list): Columns to read (default: all)
+
+    Returns:
+        pd.DataFrame: The snapshot contents
+    """
+    # The table's buffers keep the map open for as long as they are used
+    table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+    if columns is not None:
+        table = table.select(columns)
+    return _tag(table.to_pandas(types_mapper=_ARROW_STRINGS.get), path, 'snapshot', columns=columns)
+
+
+def snapshot_path(file_path):
+    """Return the Arrow snapshot published next to a workbook"""
+    return os.path.splitext(file_path)[0] + '.arrow'
+
+
+def load_published_data(file_path, columns=None):
+    """
+    Load a dataset published as a workbook plus an Arrow snapshot
+
+    Scripts that write a dataset for other scripts (such as the region
+    update) store an Arrow snapshot next to the workbook. The snapshot is
+    opened through a memory map when it is at least as new as the workbook;
+    otherwise the workbook itself is loaded.
+
+    Args:
+        file_path (str): Path to the published Excel file
+        columns (list): Columns to read (default: all)
+
+    Returns:
+        pd.DataFrame: The published dataset
+    """
+    path = snapshot_path(file_path)
+    if os.path.exists(path) and (not os.path.exists(file_path) or
+                                 os.path.getmtime(path) >= os.path.getmtime(file_path)):
+        try:
+            return open_snapshot(path, columns)
+        except Exception as e:
+            print(f"⚠ Ignoring unreadable snapshot {path}: {e}")
+
+    return load_lead_data(file_path, columns=columns)
+
+
+def _header_names(header_row):
+    """Turn the first worksheet row into unique column names, as pandas does"""
+    names = []
+    seen = {}
+    for idx, value in enumerate(header_row):
+        name = f"Unnamed: {idx}" if value is None else str(value)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+def _rows_to_frame(rows, columns, start, dtype=None):
+    """Parse raw worksheet rows with the same type and NA inference as read_excel"""
+    chunk = TextParser(rows, names=columns, header=None, dtype=dtype).read()
+    chunk.index = pd.RangeIndex(start, start + len(chunk))
+    return _normalize_mixed_columns(chunk)
+
+
+def iter_lead_chunks(file_path, sheet_name=0, chunk_size=DEFAULT_CHUNK_SIZE, columns=None, dtype=None):
+    """
+    Stream a worksheet as DataFrames of at most chunk_size rows
+
+    Rows are read through openpyxl in read-only mode, so peak memory is set
+    by the chunk size and not by the number of rows in the sheet. Cells of
+    columns that were not requested are skipped before parsing.
+
+    Args:
+        file_path (str): Path to the Excel file
+        sheet_name: Sheet name or index to read (default: 0)
+        chunk_size (int): Maximum number of rows per chunk
+        columns (list): Columns to keep, in this order (default: all)
+        dtype (dict): Column -> dtype used when parsing the cells
+
+    Yields:
+        pd.DataFrame: Consecutive chunks of the sheet with a running RangeIndex
+    """
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        if isinstance(sheet_name, int):
+            sheet = workbook.worksheets[sheet_name]
+        else:
+            sheet = workbook[sheet_name]
+
+        rows = sheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        names = _header_names(header)
+        positions = None
+        if columns is not None:
+            missing = [col for col in columns if col not in names]
+            if missing:
+                raise ValueError(f"Columns not found in the lead data: {', '.join(missing)}")
+            positions = [names.index(col) for col in columns]
+            names = list(columns)
+
+        start = 0
+        buffer = []
+        for row in rows:
+            if positions is None:
+                buffer.append(row[:len(names)])
+            else:
+                buffer.append([row[pos] if pos < len(row) else None for pos in positions])
+            if len(buffer) >= chunk_size:
+                yield _rows_to_frame(buffer, names, start, dtype)
+                start += len(buffer)
+                buffer = []
+        if buffer:
+            yield _rows_to_frame(buffer, names, start, dtype)
+    finally:
+        workbook.close()
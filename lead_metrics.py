@@ -0,0 +1,132 @@
+"""
+Lead Metrics
+Shared definitions of active and bounced leads and cached breakdowns of a
+lead dataset, so every script computes (and reuses) the same numbers.
+Counts over the cube dimensions are answered from the persisted lead cube.
+"""
+
+from lead_cube import CUBE_DIMENSIONS, LeadCube
+from lead_data_loader import remove_unused_categories
+from result_cache import ResultCache, dataset_fingerprint
+from role_classifier import ROLE_CATEGORIES
+from string_predicates import contains_mask
+
+# Lead stages that are no longer in the sales pipeline
+INACTIVE_STAGES = ['Disqualified', 'Lost', 'Won', 'Closure - Customer', 'Closure']
+
+# Search term identifying bounced emails in Last Activity
+BOUNCE_PATTERN = 'bounce'
+
+
+def active_mask(df):
+    """Rows whose Lead Stage is not one of INACTIVE_STAGES"""
+    return ~df['Lead Stage'].isin(INACTIVE_STAGES)
+
+
+def bounced_mask(df):
+    """Rows whose Last Activity mentions a bounce"""
+    return contains_mask(df['Last Activity'], BOUNCE_PATTERN)
+
+
+# Row subsets that breakdowns can be restricted to
+SUBSETS = {
+    'active': (active_mask, {'inactive_stages': INACTIVE_STAGES}),
+    'bounced': (bounced_mask, {'bounce_pattern': BOUNCE_PATTERN})
+}
+
+
+class LeadSummaries:
+    """Cached counts and breakdowns of one lead dataset"""
+
+    def __init__(self, df, cache=None):
+        """
+        Fingerprint the dataset once for all later lookups
+
+        Args:
+            df (pd.DataFrame): Lead data
+            cache (ResultCache): Cache to use (default: ResultCache())
+        """
+        self.df = df
+        self.cache = cache if cache is not None else ResultCache()
+        self.fingerprint = dataset_fingerprint(df)
+        self._cube = None
+
+    @property
+    def cube(self):
+        """LeadCube of the dataset, built once and kept in the result cache"""
+        if self._cube is None:
+            params = {'dimensions': CUBE_DIMENSIONS, 'roles': ROLE_CATEGORIES}
+            for subset in SUBSETS:
+                params.update(SUBSETS[subset][1])
+            flags = {name: mask for name, (mask, _) in SUBSETS.items()}
+            self._cube = self.cache.get_or_compute(
+                self.fingerprint, 'lead_cube', params,
+                lambda: LeadCube.build(self.df, CUBE_DIMENSIONS, flags, ROLE_CATEGORIES)
+            )
+        return self._cube
+
+    def _where(self, subset, where=None):
+        where = dict(where or {})
+        if subset is not None:
+            where[subset] = True
+        return where
+
+    def _params(self, subset, **params):
+        if subset is not None:
+            params['subset'] = subset
+            params.update(SUBSETS[subset][1])
+        return params
+
+    def _column(self, column, subset):
+        if subset is None:
+            return self.df[column]
+        values = self.df.loc[SUBSETS[subset][0](self.df), [column]]
+        return remove_unused_categories(values)[column]
+
+    def row_count(self, subset=None):
+        """
+        Number of rows in a subset
+
+        Args:
+            subset (str): None for all rows, or a key of SUBSETS
+
+        Returns:
+            int: Row count
+        """
+        return self.cube.total(self._where(subset))
+
+    def counts(self, column, subset=None, dropna=False):
+        """
+        value_counts of a column, optionally restricted to a subset
+
+        Args:
+            column (str): Column to count
+            subset (str): None for all rows, or a key of SUBSETS
+            dropna (bool): Exclude missing values (default: False)
+
+        Returns:
+            pd.Series: Counts sorted in descending order; for cube
+                dimensions equal counts are ordered by value (see
+                LeadCube.breakdown)
+        """
+        if column in self.cube.dimensions:
+            return self.cube.counts(column, self._where(subset), dropna)
+        return self.cache.get_or_compute(
+            self.fingerprint, 'value_counts', self._params(subset, column=column, dropna=dropna),
+            lambda: self._column(column, subset).value_counts(dropna=dropna)
+        )
+
+    def breakdown(self, columns, subset=None, where=None, dropna=False):
+        """
+        Counts per combination of cube dimensions, answered from the cube
+
+        Args:
+            columns (list): Dimensions to group by
+            subset (str): None for all rows, or a key of SUBSETS
+            where (dict): Further filter, e.g. {'Region Specific': 'EU'}
+            dropna (bool): Exclude missing values (default: False)
+
+        Returns:
+            pd.Series: Counts sorted in descending order
+        """
+        return self.cube.breakdown(columns, self._where(subset, where), dropna)
@@ -0,0 +1,255 @@
+"""
+Lead Query
+Lazy queries over the lead dataset. where(), select(), group_by(), count(),
+top() and limit() only record a plan; collect() optimizes it and runs it.
+Against the columnar (Parquet) cache only the referenced columns are read
+and the filters are applied while scanning, so a single breakdown reads a
+small part of the file instead of loading the whole export.
+
+    LeadQuery.from_workbook(path).active().group_by('Country').top(10).collect()
+"""
+
+import os
+
+import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from lead_data_loader import cache_path, load_lead_data
+from lead_metrics import BOUNCE_PATTERN, INACTIVE_STAGES
+from string_predicates import contains_mask
+
+# Comparison operators accepted by where(); missing values never match,
+# except for '!=' and 'not in', which follow pandas and keep them
+OPERATORS = ['==', '!=', 'in', 'not in', '<', '<=', '>', '>=', 'contains', 'isna', 'notna']
+
+
+def _arrow_filter(column, op, value):
+    """Filter as a pyarrow dataset expression, evaluated during the scan"""
+    field = ds.field(column)
+    if op == '==':
+        return field == value
+    if op == '!=':
+        return (field != value) | field.is_null()
+    if op == 'in':
+        return field.isin(list(value))
+    if op == 'not in':
+        return ~field.isin(list(value)) | field.is_null()
+    if op == '<':
+        return field < value
+    if op == '<=':
+        return field <= value
+    if op == '>':
+        return field > value
+    if op == '>=':
+        return field >= value
+    if op == 'contains':
+        return pc.match_substring_regex(field, pattern=value, ignore_case=True)
+    if op == 'isna':
+        return field.is_null()
+    return ~field.is_null()
+
+
+def _pandas_filter(series, op, value):
+    """The same filter as a boolean mask of an in-memory column"""
+    if op == '==':
+        return series == value
+    if op == '!=':
+        return series != value
+    if op == 'in':
+        return series.isin(list(value))
+    if op == 'not in':
+        return ~series.isin(list(value))
+    if op == '<':
+        return series < value
+    if op == '<=':
+        return series <= value
+    if op == '>':
+        return series > value
+    if op == '>=':
+        return series >= value
+    if op == 'contains':
+        return pd.Series(contains_mask(series, value), index=series.index)
+    if op == 'isna':
+        return series.isna()
+    return series.notna()
+
+
+class LeadQuery:
+    """Immutable query plan over a Parquet file or a DataFrame"""
+
+    def __init__(self, source, plan=None):
+        """
+        Start a query
+
+        Args:
+            source (str or pd.DataFrame): Parquet file (e.g. the columnar
+                cache of a workbook) or an in-memory lead frame
+            plan (dict): Internal; the steps recorded so far
+        """
+        self.source = source
+        self.plan = plan or {'filters': [], 'columns': None, 'group_by': None,
+                             'aggregate': None, 'limit': None}
+
+    @classmethod
+    def from_workbook(cls, file_path, sheet_name=0):
+        """
+        Query the columnar cache of a workbook, creating the cache if needed
+
+        Args:
+            file_path (str): Path to the Excel file
+            sheet_name: Sheet name or index (default: 0)
+
+        Returns:
+            LeadQuery: Query over the cached sheet
+        """
+        path = cache_path(file_path, sheet_name)
+        if not os.path.exists(path):
+            load_lead_data(file_path, sheet_name=sheet_name)
+        if not os.path.exists(path):
+            # The cache could not be written; query the loaded frame instead
+            return cls(load_lead_data(file_path, sheet_name=sheet_name, use_cache=False))
+        return cls(path)
+
+    def _with(self, **changes):
+        plan = dict(self.plan, **changes)
+        return LeadQuery(self.source, plan)
+
+    def where(self, column, op, value=None):
+        """
+        Keep the rows matching a condition; several where() calls are ANDed
+
+        Args:
+            column (str): Column to test
+            op (str): One of OPERATORS
+            value: Value, list of values for 'in'/'not in', or a regular
+                expression for 'contains' (case-insensitive)
+
+        Returns:
+            LeadQuery: The extended query
+        """
+        if op not in OPERATORS:
+            raise ValueError(f"Unknown operator '{op}', expected one of: {', '.join(OPERATORS)}")
+        if self.plan['group_by'] is not None or self.plan['limit'] is not None:
+            raise ValueError("where() must come before group_by(), top() and limit()")
+        return self._with(filters=self.plan['filters'] + [(column, op, value)])
+
+    def active(self):
+        """Keep the active leads (Lead Stage not in INACTIVE_STAGES)"""
+        return self.where('Lead Stage', 'not in', INACTIVE_STAGES)
+
+    def bounced(self):
+        """Keep the leads whose Last Activity mentions a bounce"""
+        return self.where('Last Activity', 'contains', BOUNCE_PATTERN)
+
+    def select(self, *columns):
+        """Return only these columns"""
+        return self._with(columns=list(columns))
+
+    def group_by(self, *columns):
+        """Group by these columns; follow with count() or top()"""
+        return self._with(group_by=list(columns), aggregate='count')
+
+    def count(self):
+        """Row count per group (or in total without group_by)"""
+        return self._with(aggregate='count')
+
+    def top(self, n):
+        """The n largest groups"""
+        if self.plan['group_by'] is None:
+            raise ValueError("top() needs group_by()")
+        return self._with(limit=n)
+
+    def limit(self, n):
+        """At most n rows (or groups)"""
+        return self._with(limit=n)
+
+    def referenced_columns(self):
+        """
+        Columns the query needs to read (projection pushdown)
+
+        Returns:
+            list: Column names, or None if every column is needed
+        """
+        if self.plan['group_by'] is not None:
+            needed = list(self.plan['group_by'])
+        elif self.plan['aggregate'] == 'count':
+            needed = []
+        elif self.plan['columns'] is not None:
+            needed = list(self.plan['columns'])
+        else:
+            return None
+        for column, _, _ in self.plan['filters']:
+            if column not in needed:
+                needed.append(column)
+        return needed
+
+    def _scan_filter(self):
+        """All filters combined into one expression (predicate pushdown)"""
+        expression = None
+        for column, op, value in self.plan['filters']:
+            condition = _arrow_filter(column, op, value)
+            expression = condition if expression is None else expression & condition
+        return expression
+
+    def explain(self):
+        """
+        Describe the optimized plan
+
+        Returns:
+            str: One line per step, starting with the scan
+        """
+        source = self.source if isinstance(self.source, str) else 'DataFrame'
+        columns = self.referenced_columns()
+        lines = [f"Scan {source}",
+                 f"  columns: {'all' if columns is None else ', '.join(columns) or '(row count only)'}"]
+        for column, op, value in self.plan['filters']:
+            lines.append(f"  filter: {column} {op}" + ('' if value is None else f" {value!r}"))
+        if self.plan['group_by'] is not None:
+            lines.append(f"GroupBy {', '.join(self.plan['group_by'])} -> count, descending")
+        elif self.plan['aggregate'] == 'count':
+            lines.append("Count")
+        elif self.plan['columns'] is not None:
+            lines.append(f"Project {', '.join(self.plan['columns'])}")
+        if self.plan['limit'] is not None:
+            lines.append(f"Limit {self.plan['limit']}")
+        return '\n'.join(lines)
+
+    def _scan(self):
+        """Read the filtered, projected rows"""
+        columns = self.referenced_columns()
+        limit = self.plan['limit'] if self.plan['group_by'] is None else None
+
+        if isinstance(self.source, pd.DataFrame):
+            frame = self.source
+            mask = pd.Series(True, index=frame.index)
+            for column, op, value in self.plan['filters']:
+                mask &= _pandas_filter(frame[column], op, value).fillna(False).astype(bool)
+            frame = frame.loc[mask, columns if columns is not None else frame.columns]
+            return frame if limit is None else frame.head(limit)
+
+        dataset = ds.dataset(self.source, format='parquet')
+        if limit is not None:
+            table = dataset.head(limit, columns=columns, filter=self._scan_filter())
+        else:
+            table = dataset.to_table(columns=columns, filter=self._scan_filter())
+        return table.to_pandas()
+
+    def collect(self):
+        """
+        Run the query
+
+        Returns:
+            pd.DataFrame for row queries, pd.Series of counts (descending)
+            for group_by(), or int for count() without group_by()
+        """
+        frame = self._scan()
+        if self.plan['group_by'] is not None:
+            counts = frame.groupby(self.plan['group_by'], observed=True, dropna=False).size()
+            counts = counts[counts > 0].sort_values(ascending=False).rename('count')
+            return counts if self.plan['limit'] is None else counts.head(self.plan['limit'])
+        if self.plan['aggregate'] == 'count':
+            return len(frame)
+        if self.plan['columns'] is not None:
+            frame = frame[self.plan['columns']]
+        return frame.reset_index(drop=True)
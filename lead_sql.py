@@ -0,0 +1,159 @@
+"""
+Lead SQL
+Embedded SQLite database holding the lead table, with the analyses of the
+scripts (active leads, bounced emails, role categories, regions) exposed as
+SQL views. The database is a local file, so later queries run in-process
+without re-reading the Excel export.
+"""
+
+import os
+import sqlite3
+
+import pandas as pd
+
+from lead_data_loader import DEFAULT_CACHE_DIR
+from lead_metrics import BOUNCE_PATTERN, INACTIVE_STAGES
+from result_cache import dataset_fingerprint
+from role_classifier import ROLE_CATEGORIES, RoleClassifier
+
+# Location of the lead database
+DEFAULT_DB_PATH = os.path.join(DEFAULT_CACHE_DIR, 'leads.sqlite')
+
+# Columns indexed for fast filtering and grouping
+INDEXED_COLUMNS = ['Country', 'Lead Stage', 'Region Specific', 'Industry Vertical']
+
+
+def _quote(identifier):
+    """Quote a column or table name for SQLite"""
+    return '"' + str(identifier).replace('"', '""') + '"'
+
+
+def _literal(value):
+    """Quote a string literal for SQLite"""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _view_definitions():
+    """SQL of every analysis view, by view name"""
+    inactive = ', '.join(_literal(stage) for stage in INACTIVE_STAGES)
+    return {
+        # Same rule as lead_metrics.active_mask: a missing stage counts as active
+        'active_leads': f"""
+            SELECT * FROM leads
+            WHERE "Lead Stage" IS NULL OR "Lead Stage" NOT IN ({inactive})""",
+        # LIKE is case-insensitive, like lead_metrics.bounced_mask
+        'bounced_leads': f"""
+            SELECT * FROM leads
+            WHERE "Last Activity" LIKE {_literal('%' + BOUNCE_PATTERN + '%')}""",
+        'role_leads': """
+            SELECT r.category AS "Role Category", l.*
+            FROM lead_roles r JOIN leads l ON l.row_id = r.row_id""",
+        'active_by_country': """
+            SELECT "Country", COUNT(*) AS "Count" FROM active_leads
+            GROUP BY "Country" ORDER BY "Count" DESC""",
+        'bounced_by_country': """
+            SELECT "Country", COUNT(*) AS "Count" FROM bounced_leads
+            GROUP BY "Country" ORDER BY "Count" DESC""",
+        'roles_by_country': """
+            SELECT "Country", "Role Category", COUNT(*) AS "Count" FROM role_leads
+            GROUP BY "Country", "Role Category" ORDER BY "Count" DESC""",
+        'region_distribution': """
+            SELECT "Region Specific", COUNT(*) AS "Count" FROM leads
+            GROUP BY "Region Specific" ORDER BY "Count" DESC"""
+    }
+
+
+class LeadDatabase:
+    """SQLite copy of the lead table with the analysis views"""
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        """
+        Open (or create) the database file
+
+        Args:
+            db_path (str): Path of the SQLite file, or ':memory:'
+        """
+        if db_path != ':memory:' and os.path.dirname(db_path):
+            os.makedirs(os.path.dirname(db_path), exist_ok=True)
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
+
+    def fingerprint(self):
+        """Fingerprint of the loaded dataset, or None if nothing is loaded"""
+        try:
+            row = self.connection.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return row[0] if row else None
+
+    def sync(self, df, categories=ROLE_CATEGORIES):
+        """
+        Load a lead dataset unless the same data is already loaded
+
+        Args:
+            df (pd.DataFrame): Lead data
+            categories (dict): Role categories for the lead_roles table
+
+        Returns:
+            bool: True if the tables were (re)built
+        """
+        fingerprint = dataset_fingerprint(df)
+        if self.fingerprint() == fingerprint:
+            return False
+
+        leads = df.copy()
+        leads.insert(0, 'row_id', range(len(leads)))
+
+        # One row per (lead, matched role category)
+        role_flags = RoleClassifier(categories).classify(df['Role'])
+        role_flags.index = leads['row_id']
+        lead_roles = role_flags.rename_axis('row_id').rename_axis('category', axis=1).stack()
+        lead_roles = lead_roles[lead_roles].reset_index()[['row_id', 'category']]
+
+        with self.connection:
+            for view in _view_definitions():
+                self.connection.execute(f"DROP VIEW IF EXISTS {_quote(view)}")
+            leads.to_sql('leads', self.connection, if_exists='replace', index=False)
+            lead_roles.to_sql('lead_roles', self.connection, if_exists='replace', index=False)
+
+            self.connection.execute("CREATE INDEX idx_leads_row_id ON leads (row_id)")
+            self.connection.execute("CREATE INDEX idx_lead_roles_row_id ON lead_roles (row_id)")
+            for column in INDEXED_COLUMNS:
+                if column in leads.columns:
+                    index_name = 'idx_leads_' + ''.join(c if c.isalnum() else '_' for c in column.lower())
+                    self.connection.execute(f"CREATE INDEX {index_name} ON leads ({_quote(column)})")
+
+            for view, sql in _view_definitions().items():
+                self.connection.execute(f"CREATE VIEW {_quote(view)} AS {sql}")
+
+            self.connection.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+            self.connection.execute("INSERT OR REPLACE INTO meta VALUES ('fingerprint', ?)", (fingerprint,))
+        return True
+
+    def query(self, sql, params=None):
+        """
+        Run a SQL query against the lead tables and views
+
+        Args:
+            sql (str): SELECT statement
+            params: Optional query parameters
+
+        Returns:
+            pd.DataFrame: Query result
+        """
+        return pd.read_sql_query(sql, self.connection, params=params)
+
+    def views(self):
+        """Names of the analysis views"""
+        return list(_view_definitions())
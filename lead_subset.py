@@ -0,0 +1,145 @@
+"""
+Lead Subset
+Lazy row subset of a lead DataFrame: an array of row positions plus a
+reference to the base frame. Reads gather only the columns (or row batches)
+they need, so several overlapping subsets of a large export cost a few
+bytes per row instead of a full copy each. The subset becomes a real
+DataFrame only when it is written to.
+"""
+
+import numpy as np
+import pandas as pd
+
+from lead_data_loader import remove_unused_categories
+
+
+def _drop_unused(series):
+    """Remove categories that do not occur in the gathered rows"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.remove_unused_categories()
+    return series
+
+
+class _PositionIndexer:
+    """Supports subset.iloc[start:stop] by gathering only those rows"""
+
+    def __init__(self, subset):
+        self.subset = subset
+
+    def __getitem__(self, key):
+        if not isinstance(key, slice):
+            raise TypeError("LeadSubset.iloc only supports row slices")
+        return self.subset._slice(key)
+
+
+class LeadSubset:
+    """Read-only view of selected rows of a frame, materialized on write"""
+
+    def __init__(self, base, rows):
+        """
+        Create a view
+
+        Args:
+            base (pd.DataFrame): Frame the rows belong to
+            rows: Boolean mask over base (array or Series) or an array of row
+                positions
+        """
+        rows = rows.to_numpy() if isinstance(rows, pd.Series) else np.asarray(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        self.base = base
+        self.positions = rows
+        self._frame = None
+
+    def __len__(self):
+        return len(self.positions)
+
+    @property
+    def empty(self):
+        return len(self) == 0
+
+    @property
+    def columns(self):
+        return self.base.columns if self._frame is None else self._frame.columns
+
+    @property
+    def iloc(self):
+        """Row slices as DataFrames, e.g. for batched export"""
+        return _PositionIndexer(self)
+
+    def _gather(self, positions, columns=None):
+        """Frame of the given base positions, with unused categories removed"""
+        source = self.base if columns is None else self.base[columns]
+        return remove_unused_categories(source.take(positions))
+
+    def _slice(self, rows):
+        """Frame of a slice of the subset's rows"""
+        if self._frame is not None:
+            return self._frame.iloc[rows]
+        return self._gather(self.positions[rows])
+
+    def __getitem__(self, column):
+        """
+        One column of the subset, or a frame for a list of columns
+
+        Only the requested columns are gathered from the base frame.
+        """
+        if isinstance(column, list):
+            return self.frame(column)
+        if self._frame is not None:
+            return self._frame[column]
+        return _drop_unused(self.base[column].take(self.positions))
+
+    def __setitem__(self, column, value):
+        """Assigning to the subset turns it into its own DataFrame first"""
+        if self._frame is None:
+            self._frame = self.frame()
+        self._frame[column] = value
+
+    def frame(self, columns=None):
+        """
+        Materialize the subset (or some of its columns) as a new DataFrame
+
+        Args:
+            columns (list): Columns to include (default: all)
+
+        Returns:
+            pd.DataFrame: The selected rows
+        """
+        if self._frame is not None:
+            return (self._frame if columns is None else self._frame[columns]).copy()
+        return self._gather(self.positions, columns)
+
+    def copy(self):
+        """The subset as an independent DataFrame"""
+        return self.frame()
+
+    def head(self, n=5):
+        return self._slice(slice(0, n))
+
+    def value_counts(self, column, **kwargs):
+        """value_counts of one column, see pd.Series.value_counts"""
+        return self[column].value_counts(**kwargs)
+
+    def groupby(self, by, columns=None, **kwargs):
+        """
+        Group the subset, gathering only the key and value columns
+
+        Args:
+            by (str or list): Grouping column(s)
+            columns (list): Value columns needed by the aggregation (default:
+                none, e.g. for size())
+            **kwargs: Passed to DataFrame.groupby
+
+        Returns:
+            DataFrameGroupBy: Grouping of the gathered columns
+        """
+        keys = [by] if isinstance(by, str) else list(by)
+        needed = keys + [col for col in (columns or []) if col not in keys]
+        return self.frame(needed).groupby(by, **kwargs)
+
+    def to_parquet(self, path, **kwargs):
+        self.frame().to_parquet(path, **kwargs)
+
+    def to_csv(self, path, **kwargs):
+        self.frame().to_csv(path, **kwargs)
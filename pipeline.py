@@ -0,0 +1,287 @@
+"""
+Analysis Pipeline
+Runs analysis stages against one in-memory dataset in dependency (DAG)
+order. A stage is skipped when its code, its upstream stages and the input
+data are unchanged since its last successful run, its outputs still exist
+and none of its upstream stages ran. Stages that do not depend on each other
+run side by side in worker processes, which read the dataset from a
+memory-mapped Arrow snapshot instead of receiving a pickled copy.
+"""
+
+import contextlib
+import hashlib
+import inspect
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+from lead_data_loader import DEFAULT_CACHE_DIR, open_snapshot, write_snapshot
+from result_cache import dataset_fingerprint, tag_fingerprint
+
+# Where stage state and the frames produced by transforming stages are kept
+DEFAULT_PIPELINE_DIR = os.path.join(DEFAULT_CACHE_DIR, 'pipeline')
+
+
+def _file_digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _run_on_snapshot(func, snapshot_path, fingerprint):
+    """Worker entry point: run a stage on the snapshot and return its printed output"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        func(tag_fingerprint(open_snapshot(snapshot_path), fingerprint))
+    return output.getvalue()
+
+
+class Stage:
+    """One analysis step of a pipeline"""
+
+    def __init__(self, name, func, after=(), outputs=(), sources=(), transforms=False):
+        """
+        Describe a stage
+
+        Args:
+            name (str): Unique stage name
+            func (callable): Function taking the dataset
+            after (iterable): Names of the stages that must run first
+            outputs (iterable): Files the stage writes; a stage whose outputs
+                are missing is never skipped
+            sources (iterable): Extra modules whose code the stage depends on
+                (func's own module is always included)
+            transforms (bool): func modifies the dataset in place for the
+                stages after it
+        """
+        self.name = name
+        self.func = func
+        self.after = list(after)
+        self.outputs = list(outputs)
+        self.transforms = transforms
+        modules = [sys.modules[func.__module__]] + list(sources)
+        self.source_files = sorted({inspect.getsourcefile(module) for module in modules})
+
+    def key(self, fingerprint, upstream_keys):
+        """Digest of everything that determines this stage's results"""
+        parts = [self.name, fingerprint, [_file_digest(path) for path in self.source_files],
+                 [upstream_keys[name] for name in sorted(self.after)]]
+        return hashlib.sha1(json.dumps(parts).encode('utf-8')).hexdigest()
+
+
+class Pipeline:
+    """DAG of stages sharing one loaded dataset"""
+
+    def __init__(self, pipeline_dir=DEFAULT_PIPELINE_DIR):
+        """
+        Initialize an empty pipeline
+
+        Args:
+            pipeline_dir (str): Directory for the stage state and the frames
+                of transforming stages
+        """
+        self.pipeline_dir = pipeline_dir
+        self.stages = {}
+
+    @property
+    def _state_path(self):
+        return os.path.join(self.pipeline_dir, 'state.json')
+
+    def stage(self, name, func, **options):
+        """Add a stage; see Stage for the options"""
+        if name in self.stages:
+            raise ValueError(f"Duplicate stage name: {name}")
+        self.stages[name] = Stage(name, func, **options)
+        return self.stages[name]
+
+    def levels(self):
+        """
+        Group the stages into waves that can run at the same time
+
+        Every stage comes after all of its dependencies, and the stages of
+        one wave do not depend on each other.
+
+        Returns:
+            list: Lists of stage names (ties keep insertion order)
+        """
+        for stage in self.stages.values():
+            unknown = [name for name in stage.after if name not in self.stages]
+            if unknown:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stage(s): {', '.join(unknown)}")
+
+        remaining = {name: set(stage.after) for name, stage in self.stages.items()}
+        levels = []
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Dependency cycle between stages: {', '.join(remaining)}")
+            levels.append(ready)
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return levels
+
+    def order(self):
+        """
+        Stage names in an order that respects every dependency
+
+        Returns:
+            list: Topologically sorted stage names (ties keep insertion order)
+        """
+        return [name for level in self.levels() for name in level]
+
+    def _load_state(self):
+        if not os.path.exists(self._state_path):
+            return {}
+        try:
+            with open(self._state_path, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠ Ignoring unreadable pipeline state: {e}")
+            return {}
+
+    def _save_state(self, state):
+        os.makedirs(self.pipeline_dir, exist_ok=True)
+        tmp_path = self._state_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, self._state_path)
+
+    def _frame_path(self, name):
+        return os.path.join(self.pipeline_dir, f'{name}.parquet')
+
+    def _is_current(self, stage, key, state):
+        """True if the stage last ran with this key and its outputs still exist"""
+        if state.get(stage.name) != key:
+            return False
+        if stage.transforms and not os.path.exists(self._frame_path(stage.name)):
+            return False
+        return all(os.path.exists(path) for path in stage.outputs)
+
+    @property
+    def _snapshot_path(self):
+        return os.path.join(self.pipeline_dir, 'dataset.arrow')
+
+    def _run_parallel(self, stages, df, max_workers):
+        """
+        Run independent stages in worker processes
+
+        Errors raised by a stage propagate unchanged. Only a pool that
+        cannot be started, or that dies while running (e.g. a killed
+        worker), makes the stages fall back to this process.
+
+        Returns:
+            list: Stages that did not run and still have to run here
+        """
+        snapshot_path = write_snapshot(df, self._snapshot_path)
+        fingerprint = dataset_fingerprint(df)
+        pool = None
+        try:
+            try:
+                pool = ProcessPoolExecutor(max_workers=min(max_workers, len(stages)))
+                futures = [pool.submit(_run_on_snapshot, stage.func, snapshot_path, fingerprint)
+                           for stage in stages]
+            except (OSError, BrokenProcessPool) as e:
+                print(f"⚠ Stage pool unavailable ({e}), running stages sequentially")
+                return list(stages)
+
+            unfinished = []
+            # Print each stage's output in one block, in stage order
+            for stage, future in zip(stages, futures):
+                try:
+                    output = future.result()
+                except BrokenProcessPool as e:
+                    print(f"⚠ Stage pool stopped ({e}), running stage '{stage.name}' sequentially")
+                    unfinished.append(stage)
+                    continue
+                print("\n" + "#" * 70)
+                print(f"# Stage '{stage.name}' (worker process)")
+                print("#" * 70)
+                print(output, end='')
+            return unfinished
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+            if os.path.exists(snapshot_path):
+                os.remove(snapshot_path)
+
+    def run(self, df, force=False, max_workers=None):
+        """
+        Run every stage whose inputs changed, in dependency order
+
+        Independent stages that do not transform the dataset run in
+        parallel worker processes; stages that transform it always run in
+        this process.
+
+        Args:
+            df (pd.DataFrame): Dataset shared by all stages
+            force (bool): Run every stage even if it is up to date
+            max_workers (int): Worker processes (default: one per CPU); 1
+                runs every stage in this process
+
+        Returns:
+            dict: Stage name -> 'ran' or 'skipped'
+        """
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        state = self._load_state()
+        fingerprint = dataset_fingerprint(df)
+        keys = {}
+        results = {}
+        # Identity of the dataset as the current wave sees it; stages compute
+        # their cached summaries under it instead of hashing every row
+        data_key = fingerprint
+
+        for level in self.levels():
+            tag_fingerprint(df, data_key)
+            pending = []
+            for name in level:
+                stage = self.stages[name]
+                keys[name] = stage.key(fingerprint, keys)
+                upstream_ran = any(results[dep] == 'ran' for dep in stage.after)
+                if not force and not upstream_ran and self._is_current(stage, keys[name], state):
+                    print("\n" + "#" * 70)
+                    print(f"# Stage '{name}': inputs unchanged, skipped")
+                    print("#" * 70)
+                    results[name] = 'skipped'
+                else:
+                    pending.append(stage)
+
+            # Stages of one wave all see the dataset as it was before the wave
+            parallel = [stage for stage in pending if not stage.transforms]
+            if max_workers > 1 and len(parallel) > 1:
+                unfinished = self._run_parallel(parallel, df, max_workers)
+                for stage in parallel:
+                    if stage not in unfinished:
+                        state[stage.name] = keys[stage.name]
+                        results[stage.name] = 'ran'
+                self._save_state(state)
+                pending = [stage for stage in pending if stage.transforms or stage in unfinished]
+
+            for stage in pending:
+                print("\n" + "#" * 70)
+                print(f"# Stage '{stage.name}'")
+                print("#" * 70)
+                stage.func(df)
+                if stage.transforms:
+                    # The wave's key no longer describes the changed frame
+                    tag_fingerprint(df, None)
+                    os.makedirs(self.pipeline_dir, exist_ok=True)
+                    df.to_parquet(self._frame_path(stage.name))
+                state[stage.name] = keys[stage.name]
+                self._save_state(state)
+                results[stage.name] = 'ran'
+
+            # Continue from the stored result of transforming stages that were skipped
+            for name in level:
+                if self.stages[name].transforms and results[name] == 'skipped':
+                    df = pd.read_parquet(self._frame_path(name))
+                if self.stages[name].transforms:
+                    data_key = self.stages[name].key(data_key, keys)
+
+        return {name: results[name] for name in self.order()}
@@ -0,0 +1,56 @@
+"""
+Lead SQL Queries
+Loads the lead export into the local SQLite database (only when the data
+changed) and runs SQL against it. Pass a query on the command line, e.g.
+
+    python query_leads.py "SELECT * FROM bounced_by_country LIMIT 5"
+
+Without an argument it lists the views and shows active leads by country
+and industry.
+"""
+
+import sys
+
+import pandas as pd
+from lead_data_loader import load_lead_data
+from lead_sql import LeadDatabase
+
+# Load the Excel file
+file_path = r"C:\Users\karul\Downloads\Raw File-LS-Full Data.xlsx"
+
+# Example ad-hoc slice
+DEFAULT_QUERY = """
+    SELECT "Country", "Industry Vertical", COUNT(*) AS "Active Leads"
+    FROM active_leads
+    GROUP BY "Country", "Industry Vertical"
+    ORDER BY "Active Leads" DESC
+    LIMIT 20
+"""
+
+
+def main():
+    """Sync the database with the export and run the requested query"""
+    print("=" * 70)
+    print("Lead SQL Queries")
+    print("=" * 70)
+
+    with LeadDatabase() as db:
+        print("\nLoading data...")
+        df = load_lead_data(file_path)
+        if db.sync(df):
+            print(f"✓ Loaded {len(df):,} rows into {db.db_path}")
+        else:
+            print(f"✓ {db.db_path} is up to date ({len(df):,} rows)")
+
+        print(f"\nViews: {', '.join(db.views())}")
+
+        sql = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_QUERY
+        print("\n" + "=" * 70)
+        print(sql.strip())
+        print("=" * 70)
+        with pd.option_context('display.max_rows', 100, 'display.width', 140):
+            print(db.query(sql).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
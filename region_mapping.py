@@ -0,0 +1,127 @@
+"""
+Region Mapping Engine
+Assigns Region Specific from a country -> region table in one vectorized pass
+and produces the change log from that same pass.
+"""
+
+import pandas as pd
+
+from result_cache import tag_fingerprint
+
+# Countries that belong to each region
+REGION_RULES = {
+    'ME': [
+        'Saudi Arabia',
+        'Bahrain',
+        'Oman',
+        'Kuwait',
+        'United Arab Emirates',
+        'Qatar'
+    ],
+    'EU': [
+        'Germany',
+        'Switzerland',
+        'Austria',
+        'Belgium',
+        'Netherlands',
+        'Luxembourg',
+        'Denmark',
+        'Sweden',
+        'Norway',
+        'Finland',
+        'United Kingdom'
+    ]
+}
+
+# Alternative spellings found in the CRM export -> canonical country name
+COUNTRY_ALIASES = {
+    'The Netherlands': 'Netherlands'
+}
+
+
+def build_region_table(rules=REGION_RULES, aliases=COUNTRY_ALIASES):
+    """
+    Flatten the region rules into a country -> region lookup
+
+    Args:
+        rules (dict): Region -> list of countries
+        aliases (dict): Alias -> canonical country name
+
+    Returns:
+        dict: Country (including aliases) -> region
+    """
+    table = {}
+    for region, countries in rules.items():
+        for country in countries:
+            table[country] = region
+    for alias, country in aliases.items():
+        if country in table:
+            table[alias] = table[country]
+    return table
+
+
+def assign_regions(df, region_table=None, country_column='Country', region_column='Region Specific'):
+    """
+    Apply the region table to a lead frame in place
+
+    Every rule is applied with one map over the country column; for a
+    category column the lookup runs once per distinct country.
+
+    Args:
+        df (pd.DataFrame): Lead data
+        region_table (dict): Country -> region, defaults to build_region_table()
+        country_column (str): Column holding the country
+        region_column (str): Column to update
+
+    Returns:
+        dict: Change log with 'changes' (one row per updated record),
+            'country_breakdown' (per rule country) and 'summary' counts
+    """
+    if region_table is None:
+        region_table = build_region_table()
+
+    countries = df[country_column]
+    before = df[region_column].astype(object)
+    target = countries.map(region_table).astype(object)
+
+    matched = target.notna()
+    changed = matched & (before != target)
+    after = before.where(~matched, target)
+
+    if isinstance(df[region_column].dtype, pd.CategoricalDtype):
+        df[region_column] = after.astype('category')
+    else:
+        df[region_column] = after
+    tag_fingerprint(df, None)
+
+    changes = pd.DataFrame({
+        country_column: countries[changed],
+        f'{region_column} (Before)': before[changed],
+        region_column: after[changed]
+    })
+
+    breakdown = pd.DataFrame({
+        'Country': countries[matched].astype(object),
+        'Region': target[matched],
+        'Updated': changed[matched]
+    }).groupby(['Region', 'Country']).agg(
+        **{'Total Records': ('Updated', 'size'), 'Records Updated': ('Updated', 'sum')}
+    )
+    all_rules = pd.MultiIndex.from_tuples(
+        [(region, country) for country, region in region_table.items()],
+        names=['Region', 'Country']
+    )
+    breakdown = breakdown.reindex(all_rules, fill_value=0).reset_index()
+    breakdown['Already Correct'] = breakdown['Total Records'] - breakdown['Records Updated']
+
+    summary = {
+        'rule_records': int(matched.sum()),
+        'records_updated': int(changed.sum()),
+        'records_already_correct': int(matched.sum() - changed.sum())
+    }
+
+    return {
+        'changes': changes,
+        'country_breakdown': breakdown,
+        'summary': summary
+    }
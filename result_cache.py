@@ -0,0 +1,167 @@
+"""
+Result Cache
+Content-addressed on-disk cache for derived summaries. Each entry is keyed by
+the fingerprint of the input dataset plus the analysis name and parameters,
+and the cache evicts least recently used entries once it exceeds its size limit.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+
+import pandas as pd
+
+# Default location and size limit of the result cache
+DEFAULT_RESULT_CACHE_DIR = os.path.join('reports', '.cache', 'results')
+DEFAULT_MAX_CACHE_BYTES = 256 * 1024**2
+
+# DataFrame.attrs entry holding a fingerprint recorded by tag_fingerprint
+FINGERPRINT_ATTR = 'fingerprint'
+
+
+def tag_fingerprint(df, fingerprint):
+    """
+    Record an already known fingerprint of a frame
+
+    The loaders tag the frames they return with the identity of the file
+    they read (path, sheet, size and modification time, see cache_key) and
+    the pipeline tags the dataset with its stage keys, so dataset_fingerprint
+    does not have to hash every row. The tag belongs to this frame object:
+    frames derived from it inherit DataFrame.attrs but are hashed again.
+    Functions that change a tagged frame in place must re-tag it, or pass
+    None to remove the tag.
+
+    Args:
+        df (pd.DataFrame): Frame to tag
+        fingerprint (str): Fingerprint of its contents, or None
+
+    Returns:
+        pd.DataFrame: The same frame, for chaining
+    """
+    if fingerprint is None:
+        df.attrs.pop(FINGERPRINT_ATTR, None)
+    else:
+        df.attrs[FINGERPRINT_ATTR] = (id(df), fingerprint)
+    return df
+
+
+def dataset_fingerprint(df):
+    """
+    Fingerprint the contents of a DataFrame
+
+    Returns the fingerprint recorded with tag_fingerprint if there is one.
+    Otherwise hashes the column names, dtypes and every row (including the
+    index), so any change to the data yields a different fingerprint.
+
+    Args:
+        df (pd.DataFrame): Dataset to fingerprint
+
+    Returns:
+        str: Hex digest identifying the dataset contents
+    """
+    tag = df.attrs.get(FINGERPRINT_ATTR)
+    if tag is not None and tag[0] == id(df):
+        return tag[1]
+    digest = hashlib.sha1()
+    digest.update(json.dumps([str(col) for col in df.columns]).encode('utf-8'))
+    digest.update(json.dumps([str(dtype) for dtype in df.dtypes]).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Pickled analysis results stored under reports/.cache/results"""
+
+    def __init__(self, cache_dir=DEFAULT_RESULT_CACHE_DIR, max_bytes=DEFAULT_MAX_CACHE_BYTES):
+        """
+        Initialize the cache
+
+        Args:
+            cache_dir (str): Directory holding the cache entries
+            max_bytes (int): Total size above which old entries are evicted
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+    def key(self, fingerprint, name, params=None):
+        """Content address of one analysis result"""
+        raw = json.dumps([fingerprint, name, params], sort_keys=True, default=str)
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def get_or_compute(self, fingerprint, name, params, compute):
+        """
+        Return a cached result, computing and storing it on a miss
+
+        Args:
+            fingerprint (str): dataset_fingerprint() of the input data
+            name (str): Analysis name, e.g. 'value_counts'
+            params (dict): JSON-serializable analysis parameters
+            compute (callable): Zero-argument function producing the result
+
+        Returns:
+            The cached or freshly computed result
+        """
+        path = os.path.join(self.cache_dir, f"{self.key(fingerprint, name, params)}.pkl")
+        if os.path.exists(path):
+            try:
+                with open(path, 'rb') as f:
+                    result = pickle.load(f)
+                # Refresh the timestamp so eviction removes least recently used entries
+                os.utime(path)
+                return result
+            except Exception as e:
+                print(f"⚠ Ignoring unreadable cache entry {path}: {e}")
+
+        result = compute()
+        self._store(path, result)
+        return result
+
+    def _store(self, path, result):
+        """Write one entry atomically, then enforce the size limit"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # A unique temporary file, as parallel stage workers may store the same key
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"⚠ Could not write result cache entry: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._evict()
+
+    def _evict(self):
+        """Delete the least recently used entries until the cache fits in max_bytes"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.pkl'):
+                continue
+            entry_path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(entry_path)
+            except FileNotFoundError:
+                # Evicted by another process in the meantime
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(entry_path)
+                total -= size
+            except OSError:
+                pass
+
+    def clear(self):
+        """Remove every cached result"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.pkl'):
+                os.remove(os.path.join(self.cache_dir, name))
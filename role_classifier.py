@@ -0,0 +1,111 @@
+"""
+Role Classifier
+Tags each lead with every role category whose keywords occur in its Role,
+matching all keywords in one pass and classifying each distinct Role once.
+"""
+
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from string_predicates import PREDICATE_CACHE_SIZE, distinct_codes
+
+# Search terms for each role category (case-insensitive substring match)
+ROLE_CATEGORIES = {
+    'HR Leads': ['hr', 'human resource', 'human capital', 'people', 'talent'],
+    'IT Leads': ['it ', 'information technology', 'technology', 'tech ', 'cio', 'chief information'],
+    'Finance Leads': ['finance', 'financial', 'cfo', 'chief financial'],
+    'CEO': ['ceo', 'chief executive'],
+    'CFO': ['cfo', 'chief financial officer']
+}
+
+
+class RoleClassifier:
+    """Multi-keyword, multi-label role matcher built on one compiled alternation"""
+
+    def __init__(self, categories=ROLE_CATEGORIES):
+        """
+        Compile the matcher for a set of role categories
+
+        Args:
+            categories (dict): Category name -> list of keywords
+        """
+        self.categories = list(categories)
+        keyword_categories = {}
+        for idx, (category, keywords) in enumerate(categories.items()):
+            for keyword in keywords:
+                keyword_categories.setdefault(keyword.lower(), set()).add(idx)
+
+        # A match of a keyword implies a match of every keyword it contains,
+        # which covers the shorter keywords that the regex does not report
+        # at the same position.
+        self._implied = {}
+        for keyword in keyword_categories:
+            implied = set()
+            for other, indexes in keyword_categories.items():
+                if other in keyword:
+                    implied |= indexes
+            self._implied[keyword] = sorted(implied)
+
+        # Lookahead finds a (longest) keyword at every position, so
+        # overlapping keywords are not swallowed by earlier matches
+        alternation = '|'.join(re.escape(k) for k in sorted(keyword_categories, key=len, reverse=True))
+        self._pattern = re.compile(f'(?=({alternation}))', re.IGNORECASE)
+        self._classify_cached = lru_cache(maxsize=PREDICATE_CACHE_SIZE)(self._classify_text)
+
+    def classify_value(self, text):
+        """
+        Return the categories matched by a single Role string
+
+        Args:
+            text (str): Role value
+
+        Returns:
+            np.ndarray: Boolean flag per category, in self.categories order
+        """
+        return self._classify_cached(text)
+
+    def _classify_text(self, text):
+        flags = np.zeros(len(self.categories), dtype=bool)
+        for match in self._pattern.finditer(text):
+            flags[self._implied[match.group(1).lower()]] = True
+        # Shared through the cache, so keep it immutable
+        flags.flags.writeable = False
+        return flags
+
+    def classify(self, roles):
+        """
+        Tag every row with all matching categories
+
+        Each distinct Role value is classified once (and remembered across
+        calls) and the result is broadcast back to the rows through its code.
+
+        Args:
+            roles (pd.Series): Role column
+
+        Returns:
+            pd.DataFrame: Boolean frame with one column per category,
+                aligned with roles.index
+        """
+        codes, uniques = distinct_codes(roles)
+        # One extra all-False row for missing values (code -1)
+        matrix = np.zeros((len(uniques) + 1, len(self.categories)), dtype=bool)
+        for idx, value in enumerate(uniques):
+            matrix[idx] = self.classify_value(str(value))
+        return pd.DataFrame(matrix[codes], index=roles.index, columns=self.categories)
+
+
+def counts_by_country(role_flags, countries):
+    """
+    Count the tagged rows of every category per country with one groupby
+
+    Args:
+        role_flags (pd.DataFrame): Output of RoleClassifier.classify
+        countries (pd.Series): Country column aligned with role_flags
+
+    Returns:
+        pd.DataFrame: Country x category counts, missing countries as NaN
+    """
+    return role_flags.groupby(countries, observed=True, dropna=False).sum()
@@ -0,0 +1,91 @@
+"""
+Lead Analysis Pipeline
+Loads the raw export once and runs the region update, company name
+resolution, the active leads, email bounced and role analyses and the
+presentation as stages of one pipeline, skipping stages whose inputs have
+not changed. The active leads,
+email bounced and role analyses run side by side in worker processes.
+
+    python run_pipeline.py            # run stages that are out of date
+    python run_pipeline.py --force    # run every stage
+    python run_pipeline.py --serial   # run every stage in this process
+"""
+
+import sys
+
+import create_presentation
+import email_bounced_analysis
+import entity_resolution
+import find_active_leads
+import improve_pie_chart
+import lead_metrics
+import region_mapping
+import role_analysis_by_country
+import role_classifier
+import update_regions
+from lead_data_loader import load_lead_data
+from pipeline import Pipeline
+
+# Load the Excel file
+file_path = r"C:\Users\karul\Downloads\Raw File-LS-Full Data.xlsx"
+
+
+def build_pipeline():
+    """
+    Define the analysis stages and their dependencies
+
+    Returns:
+        Pipeline: The lead analysis pipeline
+    """
+    pipeline = Pipeline()
+    pipeline.stage('regions', update_regions.apply_region_updates, transforms=True,
+                   sources=[region_mapping],
+                   outputs=['reports/Raw_File_LS_Updated_Regions_Final.xlsx',
+                            'reports/Raw_File_LS_Updated_Regions_Final.arrow',
+                            'reports/region_update_log.xlsx'])
+    # Adds the canonical 'Company ID' used by the stages below
+    pipeline.stage('companies', entity_resolution.add_company_ids, after=['regions'], transforms=True)
+    pipeline.stage('active_leads', find_active_leads.analyze, after=['companies'],
+                   sources=[lead_metrics],
+                   outputs=['reports/active_leads_comprehensive.xlsx', 'reports/active_leads_by_country.png'])
+    pipeline.stage('bounced', email_bounced_analysis.analyze, after=['companies'],
+                   sources=[lead_metrics],
+                   outputs=['reports/email_bounced_analysis.xlsx', 'reports/bounced_by_country.png'])
+    pipeline.stage('roles', role_analysis_by_country.analyze, after=['companies'],
+                   sources=[role_classifier],
+                   outputs=['reports/role_analysis_by_country.xlsx', 'reports/role_category_totals.png'])
+    # Replaces the stage pie chart written by active_leads
+    pipeline.stage('stage_charts', improve_pie_chart.analyze, after=['active_leads'],
+                   sources=[lead_metrics],
+                   outputs=['reports/active_leads_by_stage.png', 'reports/active_leads_by_stage_bar.png'])
+    pipeline.stage('presentation', create_presentation.build_presentation,
+                   after=['stage_charts', 'bounced', 'roles'], sources=[lead_metrics],
+                   outputs=['reports/Excel_Data_Analysis_Presentation_Final.pptx'])
+    return pipeline
+
+
+def main():
+    """Load the export once and run the pipeline"""
+    print("=" * 70)
+    print("Lead Analysis Pipeline")
+    print("=" * 70)
+
+    # Load data
+    print("\nLoading data...")
+    df = load_lead_data(file_path)
+    print(f"✓ Loaded {len(df):,} rows and {len(df.columns)} columns")
+
+    options = sys.argv[1:]
+    results = build_pipeline().run(df, force='--force' in options,
+                                   max_workers=1 if '--serial' in options else None)
+
+    print("\n" + "=" * 70)
+    print("✓ Pipeline Complete!")
+    print("=" * 70)
+    for name, status in results.items():
+        print(f"  {name:<20} {status}")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Streaming Sketches
+Fixed-size summaries of a column that are updated one chunk at a time:
+HyperLogLog for the number of distinct values and Space-Saving for the most
+frequent values. Their memory does not grow with the number of rows or of
+distinct values, so high-cardinality columns such as Email or Phone Number
+can be profiled in one pass over exports of any size.
+"""
+
+import numpy as np
+import pandas as pd
+
+# HyperLogLog precision: 2**14 one-byte registers, about 0.8% standard error
+DEFAULT_HLL_PRECISION = 14
+
+# Frequent values tracked per column by Space-Saving
+DEFAULT_TOP_K = 100
+
+
+def _value_hashes(series):
+    """64-bit hashes of the non-missing values; equal for object, string and category data"""
+    return pd.util.hash_pandas_object(series.dropna(), index=False).to_numpy()
+
+
+def _bit_length(values):
+    """Number of significant bits of each uint64 value (0 for 0)"""
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    # 32-bit halves convert to float exactly, so frexp gives exact bit lengths
+    return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+
+
+class HyperLogLog:
+    """Approximate distinct count with a standard error of about 1.04 / sqrt(2**precision)"""
+
+    def __init__(self, precision=DEFAULT_HLL_PRECISION):
+        """
+        Initialize an empty sketch
+
+        Args:
+            precision (int): Number of hash bits used to pick a register (4-18)
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError(f"HyperLogLog precision must be between 4 and 18, got {precision}")
+        self.precision = precision
+        self.registers = np.zeros(2 ** precision, dtype=np.uint8)
+
+    def update(self, series):
+        """
+        Add the values of a chunk
+
+        Args:
+            series (pd.Series): Column values; missing values are ignored
+        """
+        hashes = _value_hashes(series)
+        if len(hashes) == 0:
+            return
+        rest_bits = 64 - self.precision
+        index = (hashes >> np.uint64(rest_bits)).astype(np.intp)
+        rest = hashes & np.uint64((1 << rest_bits) - 1)
+        # Position of the leftmost 1-bit in the remaining bits
+        rank = (rest_bits - _bit_length(rest) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other):
+        """Combine with a sketch of other data built with the same precision"""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self):
+        """
+        Estimated number of distinct values
+
+        Returns:
+            int: Distinct count, using linear counting for small cardinalities
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
+
+
+class SpaceSaving:
+    """Top-k frequent values with counts that overestimate by at most the reported error"""
+
+    def __init__(self, capacity=DEFAULT_TOP_K):
+        """
+        Initialize an empty summary
+
+        Args:
+            capacity (int): Number of values tracked; any value occurring in
+                more than total / capacity rows is guaranteed to be tracked
+        """
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.int64)
+        self.errors = pd.Series(dtype=np.int64)
+        self.total = 0
+
+    def _floor(self):
+        """Largest count a value missing from a full summary can have"""
+        return int(self.counts.min()) if len(self.counts) >= self.capacity else 0
+
+    def update(self, series):
+        """
+        Add the values of a chunk
+
+        The chunk's exact counts are merged into the summary (mergeable
+        Space-Saving), so the work per chunk is one value_counts.
+
+        Args:
+            series (pd.Series): Column values; missing values are ignored
+        """
+        chunk = series.value_counts(sort=False)
+        chunk = chunk[chunk > 0]
+        if len(chunk) == 0:
+            return
+        chunk.index = chunk.index.astype(object)
+        floor = self._floor()
+
+        counts = self.counts.add(chunk, fill_value=0)
+        errors = self.errors.reindex(counts.index)
+        # Values not tracked so far may have occurred up to floor times
+        untracked = errors.isna().to_numpy()
+        counts[untracked] += floor
+        errors = errors.fillna(floor)
+
+        keep = counts.sort_values(ascending=False, kind='stable').index[:self.capacity]
+        self.counts = counts[keep].astype(np.int64)
+        self.errors = errors[keep].astype(np.int64)
+        self.total += int(chunk.sum())
+
+    def top(self, k=None):
+        """
+        Most frequent values
+
+        Args:
+            k (int): Number of values (default: all tracked values)
+
+        Returns:
+            pd.Series: Estimated counts, highest first
+        """
+        ordered = self.counts.sort_values(ascending=False, kind='stable')
+        return ordered if k is None else ordered.head(k)
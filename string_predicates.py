@@ -0,0 +1,98 @@
+"""
+String Predicates
+Evaluates text filters once per distinct value (or category code) and maps
+the result back to the rows, with an LRU cache shared across calls.
+"""
+
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Number of (predicate, value) results kept by the LRU cache
+PREDICATE_CACHE_SIZE = 65536
+
+
+def distinct_codes(series):
+    """
+    Split a column into integer codes and its distinct values
+
+    Category columns reuse their existing codes; other columns are
+    factorized. Missing values get code -1.
+
+    Args:
+        series (pd.Series): Column to split
+
+    Returns:
+        tuple: (np.ndarray of codes, sequence of distinct values)
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    codes, uniques = pd.factorize(series)
+    return codes, uniques
+
+
+@lru_cache(maxsize=PREDICATE_CACHE_SIZE)
+def _evaluate(predicate, value):
+    """Cached result of one predicate on one value"""
+    return bool(predicate(value))
+
+
+def distinct_mask(series, predicate):
+    """
+    Evaluate a string predicate once per distinct value
+
+    Args:
+        series (pd.Series): Column to filter
+        predicate (callable): Hashable function taking one value and
+            returning a truthy result. Missing values are never passed in
+            and evaluate to False.
+
+    Returns:
+        pd.Series: Boolean mask aligned with series.index
+    """
+    codes, uniques = distinct_codes(series)
+    results = np.fromiter((_evaluate(predicate, value) for value in uniques),
+                          dtype=bool, count=len(uniques))
+    # Trailing False is picked up by code -1 (missing values)
+    results = np.append(results, False)
+    return pd.Series(results[codes], index=series.index)
+
+
+@lru_cache(maxsize=None)
+def contains_predicate(pattern, case=False):
+    """
+    Build the predicate for a regex search, like Series.str.contains
+
+    The same arguments always return the same function object, so cached
+    results are shared by every caller using that pattern.
+
+    Args:
+        pattern (str): Regular expression to search for
+        case (bool): Case-sensitive match (default: False)
+
+    Returns:
+        callable: Predicate for distinct_mask
+    """
+    compiled = re.compile(pattern, 0 if case else re.IGNORECASE)
+
+    def predicate(value):
+        return compiled.search(str(value)) is not None
+
+    return predicate
+
+
+def contains_mask(series, pattern, case=False):
+    """
+    Drop-in for series.astype(str).str.contains(pattern, case=case, na=False)
+
+    Args:
+        series (pd.Series): Column to search
+        pattern (str): Regular expression to search for
+        case (bool): Case-sensitive match (default: False)
+
+    Returns:
+        pd.Series: Boolean mask aligned with series.index
+    """
+    return distinct_mask(series, contains_predicate(pattern, case))
@@ -0,0 +1,183 @@
+"""
+Update Region Specific from the Country -> Region Table
+Applies the ME and EU region rules in one pass and writes the final dataset once
+"""
+
+import pandas as pd
+from datetime import datetime
+from excel_export import ExcelExport
+from lead_data_loader import load_lead_data, snapshot_path, write_snapshot
+from region_mapping import REGION_RULES, COUNTRY_ALIASES, build_region_table, assign_regions
+
+# Load the Excel file
+file_path = r"C:\Users\karul\Downloads\Raw File-LS-Full Data.xlsx"
+
+# Set to 'parquet' or 'csv' to write raw-row sheets as files next to the workbook
+raw_sidecar = None
+
+
+def apply_region_updates(df):
+    """
+    Apply the region rules in place and write the final dataset and change log
+
+    Args:
+        df (pd.DataFrame): Lead data
+    """
+    region_table = build_region_table()
+
+    print("\n" + "=" * 70)
+    print("Region Rules")
+    print("=" * 70)
+    for region, countries in REGION_RULES.items():
+        print(f"\nCountries that should have Region Specific = '{region}':")
+        for country in countries:
+            print(f"  • {country}")
+    if COUNTRY_ALIASES:
+        print("\nCountry name variations (also updated):")
+        for alias, country in COUNTRY_ALIASES.items():
+            print(f"  • {alias} → {country}")
+
+    # Apply every rule in a single pass
+    print("\n" + "=" * 70)
+    print("Updating Records")
+    print("=" * 70)
+
+    change_log = assign_regions(df, region_table)
+    summary = change_log['summary']
+    breakdown = change_log['country_breakdown']
+    changes_df = change_log['changes']
+
+    print("\n✓ Updates applied!")
+
+    print("\n📊 Records per rule country:")
+    print("-" * 70)
+    print(f"{'Country':<30} {'Region':>8} {'Total':>10} {'Already OK':>12} {'Updated':>10}")
+    print("-" * 70)
+    for _, row in breakdown.iterrows():
+        print(f"{row['Country']:<30} {row['Region']:>8} {row['Total Records']:>10,} "
+              f"{row['Already Correct']:>12,} {row['Records Updated']:>10,}")
+    print("-" * 70)
+    print(f"{'TOTAL':<30} {'':>8} {summary['rule_records']:>10,} "
+          f"{summary['records_already_correct']:>12,} {summary['records_updated']:>10,}")
+
+    # Show overall Region Specific distribution
+    print("\n" + "=" * 70)
+    print("Updated Region Specific Distribution")
+    print("=" * 70)
+
+    region_counts = df['Region Specific'].value_counts(dropna=False)
+    print(f"\n📍 All Regions:")
+    print("-" * 70)
+    print(f"{'Region':<30} {'Count':>12} {'Percentage':>12}")
+    print("-" * 70)
+
+    for region, count in region_counts.items():
+        pct = (count / len(df)) * 100
+        region_name = str(region) if pd.notna(region) else "Missing/Unknown"
+        print(f"{region_name:<30} {count:>12,} {pct:>11.2f}%")
+
+    # Show what changed
+    print("\n" + "=" * 70)
+    print("Changes Summary")
+    print("=" * 70)
+
+    print(f"\nTotal records changed: {len(changes_df):,}")
+
+    if len(changes_df) > 0:
+        print("\n📝 Changes by previous region:")
+        print("-" * 70)
+        change_summary = changes_df.groupby(
+            [changes_df['Region Specific (Before)'].fillna('Missing/Unknown'), 'Region Specific']
+        ).size().sort_values(ascending=False)
+
+        for (old_region, new_region), count in change_summary.items():
+            print(f"  {str(old_region):<30} → {new_region}: {count:>8,} records")
+
+    # Export updated data
+    print("\n" + "=" * 70)
+    print("Exporting Updated Data")
+    print("=" * 70)
+
+    output_file = 'reports/Raw_File_LS_Updated_Regions_Final.xlsx'
+    with ExcelExport(output_file) as writer:
+        writer.write(df, 'Sheet1')
+    # Memory-mapped copy for the scripts that read the final dataset
+    write_snapshot(df, snapshot_path(output_file))
+    print(f"✓ Exported updated data to: {output_file}")
+
+    # Export change log
+    with ExcelExport('reports/region_update_log.xlsx', raw_sidecar=raw_sidecar) as writer:
+        # Sheet 1: Summary
+        summary_data = {
+            'Metric': [
+                'Total Records in Dataset',
+                'Rule Country Records',
+                'Records Updated',
+                'Records Already Correct',
+                'Update Date'
+            ],
+            'Value': [
+                f"{len(df):,}",
+                f"{summary['rule_records']:,}",
+                f"{summary['records_updated']:,}",
+                f"{summary['records_already_correct']:,}",
+                datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            ]
+        }
+        writer.write(pd.DataFrame(summary_data), 'Summary')
+
+        # Sheet 2: Country Breakdown
+        writer.write(breakdown, 'Country Breakdown')
+
+        # Sheet 3: Changes Detail
+        if len(changes_df) > 0:
+            writer.write_records(changes_df, 'Changes Detail')
+
+        # Sheet 4: Region Distribution
+        region_dist = pd.DataFrame({
+            'Region': region_counts.index,
+            'Count': region_counts.values,
+            'Percentage': (region_counts.values / len(df) * 100).round(2)
+        })
+        writer.write(region_dist, 'Region Distribution')
+
+    print(f"✓ Exported change log to: reports/region_update_log.xlsx")
+
+    print("\n" + "=" * 70)
+    print("✓ Update Complete!")
+    print("=" * 70)
+
+    print("\n📊 Summary:")
+    print(f"  • Total rule country records: {summary['rule_records']:,}")
+    print(f"  • Records updated: {summary['records_updated']:,}")
+    print(f"  • Records already correct: {summary['records_already_correct']:,}")
+
+    print("\n📊 Combined Region Totals:")
+    print(f"  • ME region: {region_counts.get('ME', 0):,}")
+    print(f"  • EU region: {region_counts.get('EU', 0):,}")
+    print(f"  • USA region: {region_counts.get('USA', 0):,}")
+    print(f"  • Others region: {region_counts.get('Others', 0):,}")
+
+    print("\n📁 Generated files:")
+    print("  - reports/Raw_File_LS_Updated_Regions_Final.xlsx (Final dataset)")
+    print("  - reports/Raw_File_LS_Updated_Regions_Final.arrow (Final dataset, Arrow snapshot)")
+    print("  - reports/region_update_log.xlsx (Change log)")
+    print("=" * 70)
+
+
+def main():
+    """Apply the region rules to the raw export"""
+    print("=" * 70)
+    print("Updating Region Specific from Region Rules")
+    print("=" * 70)
+
+    # Load data
+    print("\nLoading data...")
+    df = load_lead_data(file_path)
+    print(f"✓ Loaded {len(df):,} rows and {len(df.columns)} columns")
+
+    apply_region_updates(df)
+
+
+if __name__ == "__main__":
+    main()